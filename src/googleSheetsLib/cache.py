@@ -0,0 +1,85 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, Optional
+
+
+class TTLCache:
+    """
+    Thread-safe LRU cache whose entries expire after `ttl` seconds.
+
+    Used to keep recently read values in memory so repeated reads of the same range
+    don't hit the API. A `ttl` of 0 (or less) disables the cache by default: `set` becomes
+    a no-op unless a per-entry `ttl` is given.
+
+    Attributes:
+        maxsize (int): Maximum number of entries. The least recently used is evicted first.
+        ttl (float): Lifetime of each entry, in seconds.
+
+    Args:
+        maxsize (int, optional): Maximum number of entries. Defaults to 256.
+        ttl (float, optional): Lifetime of each entry, in seconds. Defaults to 60.
+
+    Example:
+        ```python
+        cache = TTLCache(maxsize = 128, ttl = 30)
+        cache.set(('values', 'Sales!A1:C3'), data)
+        cache.get(('values', 'Sales!A1:C3')) # data, for the next 30 seconds
+        cache.set(('values', 'Sales!1:1'), headers, ttl = 600) # static range, kept longer
+        cache.get(('values', 'Sales!1:1'), ttl = 5) # only if it was stored less than 5 seconds ago
+        ```
+    """
+    def __init__(self, maxsize: int = 256, ttl: float = 60):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        # Cada entrada guarda (momento da inserção, expiração, valor), ambos em time.monotonic().
+        self._data: OrderedDict[Hashable, tuple[float, float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Any = None, ttl: Optional[float] = None) -> Any:
+        """
+        Returns the cached value for `key`, or `default` if it's missing or expired.
+
+        `ttl` lets the caller ask for fresher data: an entry stored `ttl` seconds ago or more
+        counts as a miss for this call, even if it hasn't expired yet.
+        """
+        if not self._data:
+            return default
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return default
+            stored_at, expires_at, value = entry
+            now = time.monotonic()
+            if now >= expires_at:
+                del self._data[key]
+                return default
+            if ttl is not None and now - stored_at >= ttl:
+                return default # Velha demais para quem chamou, mas ainda válida para os outros
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None):
+        """
+        Stores `value` under `key`, evicting the least recently used entry if full.
+
+        `ttl` overrides the cache's lifetime for this entry only; 0 (or less) skips storing it.
+        """
+        if ttl is None:
+            ttl = self.ttl
+        if ttl <= 0:
+            return
+        with self._lock:
+            now = time.monotonic()
+            self._data[key] = (now, now + ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self):
+        """Drops every entry."""
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
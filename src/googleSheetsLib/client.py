@@ -1,28 +1,138 @@
 import os.path
 import time
+import random
+import threading
+from concurrent.futures import ThreadPoolExecutor
+import datetime as dt
+from email.utils import parsedate_to_datetime
+import httplib2
+import google_auth_httplib2
 from google.auth.transport.requests import Request
 from google.oauth2.credentials import Credentials
 from google_auth_oauthlib.flow import InstalledAppFlow
 from googleapiclient.discovery import build, Resource
 from googleapiclient.errors import HttpError
+from googleapiclient.model import JsonModel
 from .models import Response
-from typing import Any, TYPE_CHECKING
+from .singleflight import SingleFlight
+from .ratelimit import TokenBucket, get_bucket
+from typing import Any, Optional, TYPE_CHECKING
 from .config import TOKEN_PATH, CRED_PATH, SCOPES
 from dotenv import load_dotenv
 import json
+from json.encoder import encode_basestring_ascii
+import logging
+from functools import lru_cache
+
+try:
+    import orjson # Opcional (pip install googleSheetsLib[fast]): parse de JSON bem mais rápido.
+except ImportError:
+    orjson = None
 
 load_dotenv()
 
+logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
+
+# Services já construídos, indexados por escopos e identidade da credencial.
+# Evita reconstruir o Resource (discovery + conexão TLS) a cada ClientWrapper.
+_SERVICE_CACHE: dict[tuple, tuple[Credentials, Resource]] = {}
+
+# Renovamos o token alguns minutos antes de expirar, com jitter para que vários
+# processos compartilhando a mesma credencial não renovem todos ao mesmo tempo.
+REFRESH_MARGIN = 300
+REFRESH_JITTER = 60
+
+# Status HTTP que justificam nova tentativa, e teto do backoff exponencial (segundos).
+RETRYABLE_STATUS = frozenset({429, 500, 502, 503, 504})
+MAX_BACKOFF = 60
+
+# Limite padrão de requisições por segundo (cota do Sheets: 60 por minuto por usuário).
+# Pode ser alterado pelo argumento max_qps ou pela variável de ambiente GSHEETS_MAX_QPS; 0 desliga.
+DEFAULT_MAX_QPS = 1.0
+
+# Threads usadas pelos métodos assíncronos (get_values_async, gather_values...).
+# Limita quantas requisições ficam em voo ao mesmo tempo; a cota continua controlada pelo rate limiter.
+MAX_WORKERS = 8
+
+# Timeout (segundos) das conexões HTTP. Sem ele, o httplib2 pode esperar para sempre por um socket travado.
+HTTP_TIMEOUT = 120
+
+_json_loads = orjson.loads if orjson else json.loads
+
+class OrjsonModel(JsonModel):
+    """JsonModel que codifica os corpos das requisições e decodifica as respostas da API com orjson."""
+    def serialize(self, body_value):
+        if self._data_wrapper and isinstance(body_value, dict) and 'data' not in body_value:
+            body_value = {'data': body_value}
+        try:
+            # OPT_SERIALIZE_NUMPY: valores vindos de DataFrames (np.int64, np.float64) passam direto.
+            body = orjson.dumps(body_value, option = orjson.OPT_SERIALIZE_NUMPY).decode() # type: ignore
+        except TypeError:
+            # Tipos que o orjson não conhece seguem pelo json padrão.
+            return super().serialize(body_value)
+        # O googleapiclient calcula o content-length com len(str) e o http.client codifica em latin-1,
+        # então o corpo precisa ser ASCII puro (como o json.dumps padrão gera).
+        if body.isascii():
+            return body
+        # Escapa a saída que já temos, sem serializar de novo: o encoder C do json troca cada caractere
+        # não ASCII por \uXXXX, mas também escapa aspas e barras invertidas, o que os dois replace desfazem.
+        # Toda aspa recebe a própria barra, então \" só casa com aspas escapadas por ele.
+        return encode_basestring_ascii(body)[1:-1].replace('\\"', '"').replace('\\\\', '\\')
+
+    def deserialize(self, content):
+        try:
+            body = orjson.loads(content) # type: ignore
+        except orjson.JSONDecodeError: # type: ignore
+            return super().deserialize(content)
+        if self._data_wrapper and isinstance(body, dict) and 'data' in body:
+            body = body['data']
+        return body
+
+@lru_cache(maxsize=8)
+def _load_token(path: str, mtime: float) -> dict:
+    """Lê o token.json. O mtime faz parte da chave do cache, então alterações no arquivo invalidam a entrada."""
+    with open(path) as f:
+        return json.load(f)
+
+def _retry_delay(error: HttpError, attempt: int) -> float:
+    """
+    Tempo de espera antes da próxima tentativa.
+
+    Respeita o header Retry-After (em segundos ou como HTTP-date, RFC 7231) quando presente;
+    senão usa backoff exponencial. Soma até 50% de jitter para que workers paralelos não
+    tentem novamente todos ao mesmo tempo.
+    """
+    delay = min(2 ** attempt, MAX_BACKOFF)
+    retry_after = error.resp.get('retry-after')
+    if retry_after:
+        try:
+            delay = float(retry_after)
+        except ValueError:
+            try:
+                retry_date = parsedate_to_datetime(retry_after)
+                delay = (retry_date - dt.datetime.now(dt.timezone.utc)).total_seconds()
+            except (TypeError, ValueError):
+                pass
+        delay = max(delay, 0)
+    return delay + random.random() * delay * 0.5
+
 class ClientWrapper:
     def __init__(self,
                  credentials_path: str = CRED_PATH, 
                  token_path: str = TOKEN_PATH, 
-                 scopes: list = SCOPES):
+                 scopes: list = SCOPES,
+                 max_qps: Optional[float] = None,
+                 details_enabled: bool = True):
 
         self.credentials_path = credentials_path
         self.token_path = token_path
         self.scopes = scopes
         self.creds = None # Armazenamos as credenciais separadamente
+        self.flights = SingleFlight() # Requisições de leitura em andamento, compartilhadas entre Sheets
+        # Se False, os details das respostas não guardam os corpos das requisições montadas
+        # (autofill_request, delete_request...): menos memória ao preparar lotes grandes.
+        self.details_enabled = details_enabled
 
         if '/' in token_path:
             folder = '/'.join(token_path.split('/')[:-1])
@@ -39,28 +149,63 @@ class ClientWrapper:
 
         if token_dict:
             try:
-                self.token_dict = json.loads(token_dict)
+                self.token_dict = _json_loads(token_dict)
             except Exception:
                 pass
         if creds_dict:
             try:
-                self.creds_dict = json.loads(creds_dict)
+                self.creds_dict = _json_loads(creds_dict)
             except Exception:
                 pass
 
+        self._auth_lock = threading.Lock()
+        self._refresh_at = float('inf')
+        self._local = threading.local() # Conexão HTTP de cada thread (httplib2.Http não é thread-safe)
+        self._executor: ThreadPoolExecutor | None = None
         self.service = self._authenticate()
+        self._schedule_refresh()
+
+        # Rate limiter compartilhado por todos os ClientWrappers do mesmo client_id (mesma cota).
+        # Um max_qps explícito vale para o bucket compartilhado; o padrão não sobrescreve um já configurado.
+        explicit_qps = max_qps is not None
+        if max_qps is None:
+            max_qps = float(os.getenv('GSHEETS_MAX_QPS', DEFAULT_MAX_QPS))
+        self._bucket: TokenBucket | None = None
+        if max_qps > 0:
+            self._bucket = get_bucket(getattr(self.creds, 'client_id', None), rate=max_qps * 60, per=60.0,
+                                      update=explicit_qps)
         
     def _authenticate(self) -> Resource:
         if self.token_dict:
             self.creds = Credentials.from_authorized_user_info(self.token_dict, self.scopes)
         elif os.path.exists(self.token_path):
-            self.creds = Credentials.from_authorized_user_file(self.token_path, self.scopes)
+            token_info = _load_token(self.token_path, os.path.getmtime(self.token_path))
+            self.creds = Credentials.from_authorized_user_info(token_info, self.scopes)
         
         # Lógica inicial de login
         if not self.creds or not self.creds.valid:
             self._refresh_or_login()
-        
-        return build('sheets', 'v4', credentials=self.creds)
+
+        key = self._service_key()
+        if key in _SERVICE_CACHE:
+            # Reaproveitamos também a credencial, para que renovações valham para o service compartilhado.
+            self.creds, service = _SERVICE_CACHE[key]
+            return service
+
+        http = google_auth_httplib2.AuthorizedHttp(self.creds, http=httplib2.Http(timeout=HTTP_TIMEOUT))
+        model = OrjsonModel() if orjson else None
+        service = build('sheets', 'v4', http=http, model=model, static_discovery=True)
+        _SERVICE_CACHE[key] = (self.creds, service) # type: ignore
+        return service
+
+    def _service_key(self) -> tuple:
+        """Chave do cache de services: escopos + identidade da credencial (client_id e refresh_token)."""
+        refresh_token = getattr(self.creds, 'refresh_token', None)
+        if refresh_token:
+            identity = (getattr(self.creds, 'client_id', None), refresh_token)
+        else:
+            identity = id(self.creds)
+        return (tuple(sorted(self.scopes)), identity)
 
     def _refresh_or_login(self):
         """Lógica centralizada para renovar token ou abrir browser."""
@@ -79,7 +224,35 @@ class ClientWrapper:
                     with open(self.token_path, 'w') as token:
                         token.write(self.creds.to_json())
                 except Exception as e:
-                    print(f'Não foi possível salvar token: {e}.')
+                    logger.warning('Não foi possível salvar token: %s.', e)
+
+    def _schedule_refresh(self):
+        """Calcula (em epoch) quando o token deve ser renovado proativamente."""
+        expiry = getattr(self.creds, 'expiry', None)
+        if not expiry:
+            self._refresh_at = float('inf')
+            return
+        # A expiry do google-auth é um datetime ingênuo em UTC.
+        expiry_epoch = expiry.replace(tzinfo=dt.timezone.utc).timestamp()
+        self._refresh_at = expiry_epoch - REFRESH_MARGIN - random.uniform(0, REFRESH_JITTER)
+
+    def _refresh_auth(self):
+        """Renova o token antes da expiração. Só é chamado quando o horário agendado é atingido."""
+        with self._auth_lock:
+            # A credencial pode ser compartilhada e já ter sido renovada por outra thread ou ClientWrapper.
+            self._schedule_refresh()
+            if time.time() < self._refresh_at:
+                return
+            if self.creds and self.creds.refresh_token:
+                try:
+                    self.creds.refresh(Request())
+                except Exception as e:
+                    logger.warning('Não foi possível renovar o token: %s. Nova tentativa em 1 minuto.', e)
+                    self._refresh_at = time.time() + 60
+                    return
+            else:
+                self._ensure_valid_auth()
+            self._schedule_refresh()
 
     def _ensure_valid_auth(self):
         """Verifica se a autenticação expirou e renova se necessário antes de um comando."""
@@ -87,25 +260,48 @@ class ClientWrapper:
             return
         if not self.creds.valid:
             if self.creds.expired and self.creds.refresh_token:
-                print("Token expirado detectado. Renovando autenticação...")
+                logger.info('Token expirado detectado. Renovando autenticação...')
                 self._refresh_or_login()
                 # Opcional: recriar o service se o transporte HTTP for sensível à troca
                 # self.service = build('sheets', 'v4', credentials=self.creds)
 
+    def _http(self) -> google_auth_httplib2.AuthorizedHttp:
+        """
+        Conexão autorizada da thread atual. Cada thread mantém a sua, reaproveitada entre chamadas:
+        o httplib2 guarda a conexão TLS aberta, então só a primeira requisição de cada thread paga o handshake.
+        Um Http nunca é usado por duas threads ao mesmo tempo.
+        """
+        http = getattr(self._local, 'http', None)
+        if http is None or http.credentials is not self.creds:
+            http = self._local.http = google_auth_httplib2.AuthorizedHttp(self.creds, http=httplib2.Http(timeout=HTTP_TIMEOUT))
+        return http
+
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        """Pool de threads usado pelos métodos assíncronos, criado no primeiro uso."""
+        if self._executor is None:
+            with self._auth_lock:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(max_workers=MAX_WORKERS, thread_name_prefix='gsheets')
+        return self._executor
+
     def execute(self, request, max_retries: int = 3) -> Response[Any]: # type: ignore
         """Executa uma requisição com pre-flight check e retry."""
-        self._ensure_valid_auth() # <-- Checagem antes de rodar
+        if time.time() >= self._refresh_at: # <-- Checagem barata antes de rodar
+            self._refresh_auth()
         
         for attempt in range(max_retries):
+            if self._bucket:
+                self._bucket.acquire()
             try:
                 # Importante: se você recriou o service no _ensure_valid_auth,
                 # a 'request' antiga pode falhar. Por isso, o ideal é que a request
                 # seja construída logo antes do execute nas classes core.
-                return Response.success(data=request.execute())
+                return Response.success(data=request.execute(http=self._http()))
             
             except HttpError as e:
-                if e.resp.status in [429, 500, 502, 503, 504] and attempt < max_retries - 1:
-                    time.sleep(2 ** attempt)
+                if e.resp.status in RETRYABLE_STATUS and attempt < max_retries - 1:
+                    time.sleep(_retry_delay(e, attempt))
                     continue
                 return Response.fail(message=str(e), code=e.resp.status)
             except Exception as e:
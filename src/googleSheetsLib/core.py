@@ -1,12 +1,26 @@
 from __future__ import annotations
 from .client import *
-from .models import Response, InputOption, InsertDataOption, MajorDimension
+from .models import Response, InputOption, InsertDataOption, MajorDimension, ValueRenderOption, DateTimeRenderOption
 from googleapiclient.discovery import Resource
 from .utils import *
-from typing import Literal, get_args, TYPE_CHECKING
+from .cache import TTLCache
+from typing import Callable, Literal, get_args, TYPE_CHECKING
 import datetime as dt
-import pandas as pd
 import logging
+import time
+import copy
+import csv
+import itertools
+import threading
+import re
+import importlib.util
+import asyncio
+import functools
+import weakref
+
+# pandas (e pyarrow, opcional) são importados só por to_df/transform: o import é pesado e o resto da lib não precisa deles.
+if TYPE_CHECKING:
+    import pandas as pd
 
 
 logger = logging.getLogger(__name__)
@@ -14,6 +28,109 @@ logger.addHandler(logging.NullHandler())
 
 TEST_SHEET_ID = '1WUBUMIw0fk_dnFO_jnMUTCMS_t_esnYKPYndZIFXhIs'
 
+# Valores aceitos pelos Literals, calculados uma única vez.
+_INPUT_OPTIONS = frozenset(get_args(InputOption))
+_INSERT_OPTIONS = frozenset(get_args(InsertDataOption))
+_MAJOR_DIMENSIONS = frozenset(get_args(MajorDimension))
+_VALUE_RENDER_OPTIONS = frozenset(get_args(ValueRenderOption))
+_DATE_TIME_RENDER_OPTIONS = frozenset(get_args(DateTimeRenderOption))
+
+# Linhas por requisição em append_values. Appends maiores são enviados em partes, em sequência.
+APPEND_CHUNK_ROWS = 5000
+
+# Campos de metadados usados por build_metadata. Pedir só eles reduz bastante o payload do spreadsheets.get.
+_METADATA_FIELDS = 'properties(title,locale,timeZone),sheets.properties(sheetId,title,gridProperties(rowCount,columnCount))'
+
+# Campos da resposta do values.update copiados para os details, com o nome usado nos details.
+_UPDATE_RESULT_FIELDS = (('updatedRange', 'updated_range'),
+                         ('updatedCells', 'updated_cells'),
+                         ('updatedRows', 'updated_rows'),
+                         ('updatedColumns', 'updated_columns'))
+
+def _arrow_frame(values:list[list], headers:list, skip:int) -> pd.DataFrame:
+    """
+    Builds an Arrow-backed DataFrame column by column, without going through an object ndarray.
+
+    The API omits trailing empty cells, so rows are padded to the header width.
+    """
+    import pandas as pd
+    import pyarrow as pa
+    width = len(headers)
+    columns = [[] for _ in range(width)]
+    for row in itertools.islice(values, skip, None):
+        for i in range(width):
+            columns[i].append(row[i] if i < len(row) else None)
+    table = pa.Table.from_arrays([pa.array(col) for col in columns],
+                                 names = [str(h) for h in headers])
+    df = table.to_pandas(types_mapper = pd.ArrowDtype)
+    df.columns = headers
+    return df
+
+def _values_frame(values, headers:list, dtype, dtype_backend) -> pd.DataFrame:
+    """
+    Turns the values read from a range into a DataFrame. Shared by `Sheet.to_df` and `Spreadsheet.to_dfs`.
+    """
+    import pandas as pd
+    try:
+        if values:
+            rows = values
+            if not headers and len(values)>1:
+                headers = values[0]
+                rows = itertools.islice(values, 1, None) # Evita copiar a lista com values[1:]
+            if not headers:
+                headers = [n for n in range(len(values[0]))]
+            if dtype_backend == 'pyarrow' and dtype is None and importlib.util.find_spec('pyarrow') is not None:
+                try:
+                    return _arrow_frame(values, list(headers), 1 if rows is not values else 0)
+                except (TypeError, ValueError, NotImplementedError) as e: # Erros do Arrow herdam destes
+                    # Colunas com tipos misturados (comum com UNFORMATTED_VALUE): segue pelo caminho padrão.
+                    logger.debug('Arrow conversion failed, falling back to pandas: %s', e)
+            if dtype is not None and not isinstance(dtype, dict):
+                # dtype único: o construtor já converte direto, sem inferir object e copiar de novo no astype.
+                df = pd.DataFrame(rows if isinstance(rows, list) else list(rows), columns = headers, dtype = dtype)
+            else:
+                df = pd.DataFrame.from_records(rows, columns = headers)
+                if dtype is not None:
+                    df = df.astype(dtype)
+            if dtype_backend:
+                df = df.convert_dtypes(dtype_backend = dtype_backend)
+            return df
+        else:
+            return pd.DataFrame()
+    except Exception as e:
+        logger.warning('Not possible to create dataframe: %s. Returning empty one instead.', e)
+        return pd.DataFrame()
+
+def _unwrap_values(value_range:dict, request_range:str):
+    """
+    Extracts the values of a ValueRange returned by the API. A single requested cell
+    comes back as a scalar instead of `[[value]]`.
+    """
+    values = value_range.get('values')
+    _, sep, cells = request_range.rpartition('!') # Sem '!' é a aba inteira, mesmo que o nome pareça uma célula
+    if values and sep and is_cell(cells) and len(values[0]) == 1:
+        return values[0][0]
+    return values
+
+# ClientWrappers padrão do processo, um por combinação de token, credencial e escopos.
+_default_clients: dict[tuple, ClientWrapper] = {}
+_default_clients_lock = threading.Lock()
+
+def _get_or_create_default(token_fp:str, cred_fp:str, scopes:list[str]) -> ClientWrapper:
+    """
+    Returns the process-wide ClientWrapper for the given auth configuration, creating it
+    on first use, so Spreadsheets opened with the same configuration share authentication,
+    service and rate limiter.
+    """
+    key = (token_fp, cred_fp, tuple(scopes))
+    with _default_clients_lock:
+        client = _default_clients.get(key)
+        if client is None:
+            client = _default_clients[key] = ClientWrapper(token_path=token_fp,
+                                                           credentials_path=cred_fp,
+                                                           scopes=scopes)
+        return client
+
 class Spreadsheet:
     """
     Interface to handle Google Spreadsheets operations via API.
@@ -22,7 +139,9 @@ class Spreadsheet:
     operations at the Spreadsheet level (metadata, batch updates) and acts as a 
     factory for Sheet objects.
 
-    It handles authentication internally using the `ClientWrapper` class.
+    It handles authentication internally using the `ClientWrapper` class. Unless a client is
+    given, Spreadsheets created with the same token, credentials and scopes share a single
+    process-wide `ClientWrapper`, so authentication and service discovery happen only once.
     
     For more information on the API, visit:
     https://developers.google.com/workspace/sheets/api/quickstart/python
@@ -37,15 +156,29 @@ class Spreadsheet:
         service (SpreadsheetResource): The authenticated Google Sheets API resource.
         batch_requests (list[dict]): Pending requests for the `batchUpdate` endpoint.
         batch_value_requests (list[dict]): Pending requests for the `values.batchUpdate` endpoint.
+        batch_clear_ranges (list[str]): Pending ranges for the `values.batchClear` endpoint.
         last_refreshed (dt.datetime): Timestamp of the last metadata update.
         metadata (dict): Raw dictionary containing the full Spreadsheet metadata.
         sheets_info (dict): Metadata for individual tabs (id, name, grid size), indexed by tab name.
+        values_cache (TTLCache): Recently read values, used by `Sheet.get_values` when `cache_ttl` > 0.
+            Cleared by every write made through this Spreadsheet.
     
     Args:
         spreadsheet_id (str): The ID found in the Google Sheets URL.
         token_fp (str, optional): File path to the auth token. Defaults to auth/token.json.
         cred_fp (str, optional): File path to the credentials JSON. Defaults to auth/cred.json.
         scopes (list[str], optional): List of API scopes required. Defaults to SCOPES.
+        metadata_ttl (float, optional): Seconds during which the cached metadata is considered
+            fresh for non-forced refreshes (e.g. `Sheet.refresh_metadata`). Defaults to 60.
+        cache_ttl (float, optional): Seconds during which values read by `Sheet.get_values` are
+            served from memory. Defaults to 0, which disables the cache.
+        cache_size (int, optional): Maximum number of ranges kept in the values cache. Defaults to 256.
+        client (ClientWrapper, optional): Client to use instead of the shared default one.
+            When given, `token_fp`, `cred_fp` and `scopes` are ignored.
+        prefetch_ranges (list[str], optional): Ranges (`'Tab Name!A1:B2'` or tab names) fetched
+            together with the metadata in a single round trip. See `preload`.
+        auto_refresh (bool, optional): Refresh the metadata in a background thread every
+            `metadata_ttl` seconds. See `start_auto_refresh`. Defaults to False.
 
     Notes:
         You can setup the environment variables GOOGLE_SERVICE_CREDS and GOOGLE_SERVICE_TOKEN
@@ -65,20 +198,34 @@ class Spreadsheet:
         tab2 = ss.get_sheet_by_id(2084)
         ```
     """
+    __slots__ = ('client', 'spreadsheet_id', 'service', 'name', 'locale', 'timezone', 'sheets_info',
+                 'batch_requests', 'batch_value_requests', 'batch_clear_ranges', '_value_batch_option',
+                 'last_refreshed', '_id_to_name', '_metadata_ts', '_metadata_ttl', 'values_cache',
+                 '_prefetched', '_values_generation', '_values_service', '_info_cache', '_refresh_stop',
+                 '__weakref__')
+
     def __init__(self, 
                  spreadsheet_id:str,
                  token_fp:str = TOKEN_PATH,
                  cred_fp:str = CRED_PATH,
-                 scopes:list[str] = SCOPES):
+                 scopes:list[str] = SCOPES,
+                 metadata_ttl:float = 60,
+                 cache_ttl:float = 0,
+                 cache_size:int = 256,
+                 client:ClientWrapper | None = None,
+                 prefetch_ranges:list[str] | None = None,
+                 auto_refresh:bool = False):
         
-        self.client = ClientWrapper(token_path=token_fp,
-                                    credentials_path=cred_fp,
-                                    scopes=scopes)
+        if client is None:
+            client = _get_or_create_default(token_fp, cred_fp, scopes)
+        self.client = client
         if not self.client.service:
-            print('Not possible to create Google Client.')
+            logger.error('Not possible to create Google Client.')
             raise ConnectionError('Service not found. Check the credentials or the configs.')
         self.spreadsheet_id = spreadsheet_id
         self.service = self.client.service.spreadsheets() # type: ignore
+        # Cada chamada a values() monta um Resource novo a partir do discovery; guardamos um só.
+        self._values_service = self.service.values()
 
         self.name = ''
         self.locale = ''
@@ -86,15 +233,53 @@ class Spreadsheet:
         self.sheets_info = dict()
         self.batch_requests = []
         self.batch_value_requests = []
+        self.batch_clear_ranges = []
+        self._value_batch_option = None
         self.last_refreshed = dt.datetime(1999,1,1,0,0,0)
+        self._id_to_name = dict()
+        self._metadata_ts = 0.0
+        self._metadata_ttl = metadata_ttl
+        self.values_cache = TTLCache(maxsize = cache_size, ttl = cache_ttl)
+        self._prefetched = dict()
+        self._values_generation = 0
+        self._info_cache = self.get_info() # Anexado aos details das respostas; refeito em build_metadata
+        self._refresh_stop: threading.Event | None = None
+
+        # Construindo metadata (junto com os ranges pedidos, se houver, numa única requisição):
+        if not (prefetch_ranges and self.preload(prefetch_ranges).ok and self.sheets_info):
+            metadata = self._get_metadata()
+            if metadata.data:
+                self.build_metadata(metadata.data)
+            else:
+                logger.error('Not possible to build metadata. Error in the response: %s', metadata.error)
 
-        # Construindo metadata:
+        if auto_refresh:
+            self.start_auto_refresh()
 
-        metadata = self._get_metadata()
-        if metadata.data:
-            self.build_metadata(metadata.data)
-        else:
-            print('Not possible to build metadata. Error in the response.')
+    @classmethod
+    def from_client(cls, client:ClientWrapper, spreadsheet_id:str, **kwargs) -> Spreadsheet:
+        """
+        Creates a Spreadsheet that uses an existing `ClientWrapper`.
+
+        Useful to open several Spreadsheets with one authentication, or to control exactly
+        which client (and therefore rate limiter and service) each Spreadsheet uses.
+
+        Args:
+            client (ClientWrapper): Authenticated client.
+            spreadsheet_id (str): The ID found in the Google Sheets URL.
+            **kwargs: Other `Spreadsheet` arguments (e.g. `cache_ttl`).
+
+        Returns:
+            Spreadsheet: The new Spreadsheet.
+
+        Example:
+            ```python
+            client = ClientWrapper(token_path = 'auth/token.json')
+            sales = Spreadsheet.from_client(client, SALES_ID)
+            costs = Spreadsheet.from_client(client, COSTS_ID)
+            ```
+        """
+        return cls(spreadsheet_id, client = client, **kwargs)
 
     def _get_metadata(self) -> Response:
         """
@@ -105,9 +290,9 @@ class Spreadsheet:
             Response: Response object containing either the metadata in the .data field,
                 or error information if the request failed.
         """
-        request = self.service.get(spreadsheetId = self.spreadsheet_id) 
-        response = self.client.execute(request)
-        return response
+        request = self.service.get(spreadsheetId = self.spreadsheet_id, fields = _METADATA_FIELDS) 
+        key = ('metadata', self.spreadsheet_id)
+        return self.client.flights.do(key, lambda: self.client.execute(request))
     
     def build_metadata(self, metadata) -> bool:
         """
@@ -130,14 +315,10 @@ class Spreadsheet:
             spreadsheet_metadata = metadata['properties']
             sheets_metadata = metadata['sheets']
 
-            # Construíndo metadados da planilha como um todo:
-            self.name = spreadsheet_metadata['title']
-            self.locale = spreadsheet_metadata['locale']
-            self.timezone = spreadsheet_metadata['timeZone']
-            self.last_refreshed = dt.datetime.now()
-
-            # Construindo metadados das abas:
-            self.sheets_info.clear()
+            # Construindo metadados das abas em dicts novos, trocados de uma vez no final:
+            # quem lê em paralelo (ex.: refresh em background) nunca vê um dict pela metade.
+            sheets_info = {}
+            id_to_name = {}
 
             for sheet in sheets_metadata:
                 sheet = sheet['properties']
@@ -146,27 +327,44 @@ class Spreadsheet:
                 row_count = sheet['gridProperties']['rowCount']
                 column_count = sheet['gridProperties']['columnCount']
                 
-                self.sheets_info[name] = {
+                sheets_info[name] = {
                     'title': name,
                     'sheet_id' : sheet_id,
                     'row_count' : row_count,
                     'column_count' : column_count
                 }
+                id_to_name[sheet_id] = name
+
+            # Construíndo metadados da planilha como um todo:
+            self.name = spreadsheet_metadata['title']
+            self.locale = spreadsheet_metadata['locale']
+            self.timezone = spreadsheet_metadata['timeZone']
+            self.last_refreshed = dt.datetime.now()
+            self.sheets_info = sheets_info
+            self._id_to_name = id_to_name
             
+            self._metadata_ts = time.monotonic()
+            self._info_cache = self.get_info()
             return True
 
         except Exception as e:
-            print(f'Error while building metadata: {e}.')
+            logger.error('Error while building metadata: %s.', e)
             return False
 
-    def refresh_metadata(self) -> bool:
+    def refresh_metadata(self, force:bool = True) -> bool:
         """
         Method to refresh metadata. It only requests the metadata to the API and 
         sends it to the build_metadata method.
 
+        Args:
+            force (bool, optional): If False, the request is skipped while the cached
+                metadata is younger than `metadata_ttl` seconds. Defaults to True.
+
         Returns:
             bool: if the refresh failed or succeded.
         """
+        if not force and time.monotonic() - self._metadata_ts < self._metadata_ttl:
+            return True
         logger.info('Refreshing metadata')
         metadata = self._get_metadata()
         if metadata.data:
@@ -174,6 +372,47 @@ class Spreadsheet:
         else:
             return False
         
+    def start_auto_refresh(self, interval:float | None = None):
+        """
+        Starts a daemon thread that refreshes the metadata every `interval` seconds.
+
+        New or renamed tabs show up in `get_sheet` without an inline `refresh_metadata()` call,
+        and `Sheet.refresh_metadata` finds fresh metadata instead of paying a round trip.
+        A failed refresh keeps the previous metadata. Calling it again restarts the thread
+        with the new interval.
+
+        The thread only holds a weak reference to the Spreadsheet, so it stops by itself once
+        the Spreadsheet is garbage collected.
+
+        Args:
+            interval (float, optional): Seconds between refreshes. Defaults to `metadata_ttl`.
+        """
+        self.stop_auto_refresh()
+        interval = self._metadata_ttl if interval is None else interval
+        if interval <= 0:
+            raise ValueError(f'Invalid refresh interval: {interval}.')
+        stop = self._refresh_stop = threading.Event()
+        ref = weakref.ref(self)
+
+        def loop():
+            while not stop.wait(interval):
+                spreadsheet = ref()
+                if spreadsheet is None:
+                    return
+                try:
+                    spreadsheet.refresh_metadata(force = True)
+                except Exception as e:
+                    logger.warning('Background metadata refresh failed: %s.', e)
+                del spreadsheet
+
+        threading.Thread(target = loop, name = f'gsheets-metadata-{self.spreadsheet_id}', daemon = True).start()
+
+    def stop_auto_refresh(self):
+        """Stops the background metadata refresh started by `start_auto_refresh`, if any."""
+        if self._refresh_stop is not None:
+            self._refresh_stop.set()
+            self._refresh_stop = None
+
     def get_sheet(self, sheet_name:str) -> Sheet | None:
         """
         Retrieves a `Sheet` object by its name using cached metadata.
@@ -206,7 +445,7 @@ class Spreadsheet:
                 print("Tab not found or metadata outdated.")
             ```
         """
-        logger.info(f'Building Sheet object. Searching for sheet {sheet_name} in local metadata...')
+        logger.info('Building Sheet object. Searching for sheet %s in local metadata...', sheet_name)
         if sheet_name in self.sheets_info:
             sheet_info = self.sheets_info[sheet_name]
             return Sheet(
@@ -219,7 +458,7 @@ class Spreadsheet:
                 parent_spreadsheet = self
             )
         else:
-            logger.warning(f'Sheet {sheet_name} not found. Try refreshing the metadata or check your spelling.')
+            logger.warning('Sheet %s not found. Try refreshing the metadata or check your spelling.', sheet_name)
             return None
         
     def get_sheet_by_id(self, id:int) -> Sheet | None:
@@ -265,15 +504,11 @@ class Spreadsheet:
                 print("Tab not found or metadata outdated.")
             ```
         """
-        name = ''
-        for sheet_info in self.sheets_info.values():
-            if sheet_info['sheet_id'] == id:
-                name = sheet_info['title']
-                break
+        name = self._id_to_name.get(id)
         if name:
             return self.get_sheet(name)
         else:
-            logger.warning(f'Sheet ID {id} not found.')
+            logger.warning('Sheet ID %s not found.', id)
             return None
         
     def execute_batch(self) -> Response:
@@ -307,7 +542,7 @@ class Spreadsheet:
             ```
         """
         requests = self.batch_requests
-        details = self._get_dets(locals())
+        details = {'requests' : len(requests), 'spreadsheet_info' : self._info_cache}
         function_name = 'Spreadsheet.execute_batch'
         if not requests:
             return Response.fail('No request to execute.', function_name=function_name, details = details)
@@ -321,10 +556,12 @@ class Spreadsheet:
             return Response.fail(f'Error while building request: {e}', function_name=function_name, details=details)
         
         response = self.client.execute(request)
+        self._invalidate_values()
         
         if response.ok:
             response.details = details
             self.batch_requests = []
+            self._metadata_ts = 0.0 # Mudanças estruturais: o próximo refresh não forçado busca metadados novos
 
         elif response.error:
             response.error.details = details
@@ -332,7 +569,402 @@ class Spreadsheet:
 
         return response
 
+    def batch(self, value_input_option:InputOption = 'USER_ENTERED') -> BatchContext:
+        """
+        Context manager that coalesces the writes of every tab into a single flush.
+
+        Inside the block, `Sheet.update`, `Sheet.update_cell` (and the subscript assignment),
+        `Sheet.update_many` and `Sheet.clear_cells` only queue their request, and so do
+        `Sheet.autofill_drag` and `Sheet.delete_rows` (as if called with `prepare = True`).
+        On a clean exit, the value writes are sent with `execute_value_batch` (one `values.batchClear`
+        and one `values.batchUpdate`), then the structural requests with `execute_batch` (one
+        `batchUpdate`). If the block raises, everything queued inside it is discarded.
+
+        Call order is kept: a value write queued after a structural request (e.g. writing to a row
+        right after `delete_rows`), or a clear queued after updates, first sends everything queued
+        so far. Requests sent that way are no longer discarded if the block raises later.
+
+        Args:
+            value_input_option (InputOption, optional): Input mode used by the whole batch.
+
+        Returns:
+            BatchContext: the context manager. The flush result is in its `response` attribute.
+
+        Notes:
+            `Sheet.append_values` is still sent right away: the API has no batched append
+            for values.
+
+        Example:
+            ```python
+            with ss.batch() as batch:
+                ss['Sales'].clear_cells('A2:C100')
+                ss['Summary']['B2'] = '=SUM(Sales!C:C)'
+
+            print(batch.response.details['updated_ranges']) # 1
+
+            with ss.batch():
+                for row in reversed(empty_rows):
+                    ss['Sales'].delete_rows(start_row = row, end_row = row) # One batchUpdate at the end
+            ```
+        """
+        return BatchContext(self, value_input_option)
+
+    def execute_value_batch(self) -> Response:
+        """
+        Executes all pending value operations queued by `batch()` or `Sheet.batch()`.
+
+        Queued clears (`self.batch_clear_ranges`) are sent in a single `values.batchClear`
+        request, and queued updates (`self.batch_value_requests`) in a single
+        `values.batchUpdate` request. Clears are always applied before updates; a clear queued
+        after updates (through `Sheet.clear_cells`) sends the pending updates first, so the call
+        order holds.
+
+        Both queues are emptied once their request succeeds.
+
+        Returns:
+            Response: A custom response object.
+                - If successful (`response.ok` is True), contains the last API reply.
+                - If failed, contains error details and the function name context.
+
+        Example:
+            ```python
+            tab.begin_batch()
+            tab.clear_cells('A2:C100')
+            tab['A2:B3'] = [[1, 2], [3, 4]]
+            resp = ss.execute_value_batch() # Same as tab.flush_batch()
+            ```
+        """
+        function_name = 'Spreadsheet.execute_value_batch'
+        details = {
+            'cleared_ranges' : len(self.batch_clear_ranges),
+            'updated_ranges' : len(self.batch_value_requests),
+            'spreadsheet_info' : self._info_cache
+        }
+        if not self.batch_clear_ranges and not self.batch_value_requests:
+            return Response.fail('No request to execute.', function_name=function_name, details=details)
+
+        response = Response.success()
+        try:
+            requests = []
+            if self.batch_clear_ranges:
+                requests.append((self._values_service.batchClear(
+                    spreadsheetId = self.spreadsheet_id,
+                    body = {'ranges' : list(self.batch_clear_ranges)}
+                ), self.batch_clear_ranges))
+            if self.batch_value_requests:
+                requests.append((self._values_service.batchUpdate(
+                    spreadsheetId = self.spreadsheet_id,
+                    body = {
+                        'valueInputOption' : self._value_batch_option or 'USER_ENTERED',
+                        'data' : list(self.batch_value_requests)
+                    }
+                ), self.batch_value_requests))
+        except Exception as e:
+            return Response.fail(f'Error while building request: {e}', function_name=function_name, details=details)
+
+        for request, queue in requests:
+            response = self.client.execute(request)
+            self._invalidate_values()
+            if not response.ok:
+                break
+            queue.clear()
+
+        if response.ok:
+            response.details = details
+        elif response.error:
+            response.error.details = details
+            response.error.function_name = function_name
+
+        return response
+
+    def _flush_batches(self) -> Response:
+        """
+        Sends the queued value writes (`execute_value_batch`), then the queued structural
+        requests (`execute_batch`). Returns the first failed Response, or the last one.
+        With nothing queued, nothing is sent and the Response is successful.
+
+        If a request fails, whatever wasn't sent is dropped from the queues, so a later batch
+        doesn't resend stale writes, and handed back in `error.details['unsent']`.
+        """
+        if not self.batch_requests and not self.batch_clear_ranges and not self.batch_value_requests:
+            return Response.success(details = {})
+        response = self.execute_value_batch() if self.batch_clear_ranges or self.batch_value_requests else None
+        if response is None or (response.ok and self.batch_requests):
+            response = self.execute_batch()
+        if not response.ok:
+            unsent = {
+                'batch_value_requests' : list(self.batch_value_requests),
+                'batch_clear_ranges' : list(self.batch_clear_ranges),
+                'batch_requests' : list(self.batch_requests)
+            }
+            self.batch_value_requests.clear()
+            self.batch_clear_ranges.clear()
+            self.batch_requests.clear()
+            if response.error is not None and isinstance(response.error.details, dict):
+                response.error.details['unsent'] = unsent
+        return response
+
+    def _flush_before_value_write(self, clear:bool = False) -> Response | None:
+        """
+        Called right before a value write is queued. Value writes are flushed before structural
+        requests, and clears before updates, so if a write would jump ahead of one already queued
+        (any pending structural request, or pending updates for a `clear`), everything queued so far
+        is sent first to keep the call order. Returns the failed Response if that flush fails, None otherwise.
+        """
+        if self.batch_requests or (clear and self.batch_value_requests):
+            response = self._flush_batches()
+            if not response.ok:
+                return response
+        return None
+
+    def _invalidate_values(self):
+        """
+        Drops every locally kept value (cache and preloaded ranges). Called after any write request,
+        whatever its result: a write can change any range (formulas, shifted rows), and a failed or
+        timed out request may still have been applied, so no cached read can be trusted afterwards.
+
+        Also bumps `_values_generation`: reads capture it before going to the API and only cache
+        their result if it didn't change, so a read that raced with a write can't store pre-write data.
+        """
+        self._values_generation += 1
+        self.values_cache.clear()
+        self._prefetched.clear()
+
+    def preload(self, ranges:list[str], refresh_metadata:bool = True) -> Response:
+        """
+        Fetches several ranges (and optionally the metadata) in a single HTTP round trip.
+
+        All `values.get` requests, plus the `spreadsheets.get` for the metadata, are sent
+        together as one batch HTTP request. Each result is kept locally and returned by
+        the next `Sheet.get_values` call for that range without any network call
+        (and stored in the values cache, if enabled).
+
+        Args:
+            ranges (list[str]): Ranges in the `'Tab Name!A1:B2'` format, or just tab names
+                for the whole tab. They must match the `rng` later passed to `get_values`.
+            refresh_metadata (bool, optional): Also refresh the metadata in the same batch.
+                Defaults to True.
+
+        Returns:
+            Response: Successful if the batch was sent. `details['loaded']` lists the ranges
+                fetched and `details['errors']` maps the ranges that failed to their error
+                (a metadata failure is under the `'metadata'` key).
+
+        Example:
+            ```python
+            ss.preload(['Sales!A1:G100', 'Inventory'])
+            sales = ss['Sales'].get_values('A1:G100')   # No request sent
+            inventory = ss['Inventory'].get_values()    # No request sent
+            ```
+        """
+        function_name = 'Spreadsheet.preload'
+        details = {'ranges' : list(ranges), 'loaded' : [], 'errors' : {}}
+        generation = self._values_generation
+        # Ids próprios por tipo ('meta', 'values:<i>'): usar o range como id colidia com o da metadata
+        # (ex.: uma aba chamada 'metadata'). A resposta volta ao range pelo índice.
+        unique_ranges = list(dict.fromkeys(ranges))
+
+        def store_values(request_id, result, exception):
+            rng = unique_ranges[int(request_id.partition(':')[2])]
+            if exception is not None:
+                details['errors'][rng] = str(exception)
+                return
+            # Mesma chave usada por Sheet.get_values com as opções de renderização padrão.
+            key = ('values', self.spreadsheet_id, rng, 'FORMATTED_VALUE', 'SERIAL_NUMBER')
+            if self._values_generation == generation: # Houve escrita durante a leitura: não guarda o resultado
+                self._prefetched[key] = result
+                self.values_cache.set(key, result)
+            details['loaded'].append(rng)
+
+        def store_metadata(request_id, result, exception):
+            if exception is not None:
+                details['errors']['metadata'] = str(exception)
+            else:
+                self.build_metadata(result)
+
+        try:
+            batch = self.client.service.new_batch_http_request() # type: ignore
+            if refresh_metadata:
+                batch.add(self.service.get(spreadsheetId = self.spreadsheet_id, fields = _METADATA_FIELDS),
+                          callback = store_metadata, request_id = 'meta')
+            for i, rng in enumerate(unique_ranges):
+                request = self._values_service.get(spreadsheetId = self.spreadsheet_id, range = rng)
+                batch.add(request, callback = store_values, request_id = f'values:{i}')
+        except Exception as e:
+            return Response.fail(f'Error while building request: {e}', function_name=function_name, details=details)
+
+        response = self.client.execute(batch)
+        if response.ok:
+            response.details = details
+        elif response.error:
+            response.error.details = details
+            response.error.function_name = function_name
+        return response
     
+    def batch_get(self, ranges:list[str],
+                  value_render_option:ValueRenderOption = 'FORMATTED_VALUE',
+                  date_time_render_option:DateTimeRenderOption = 'SERIAL_NUMBER') -> Response:
+        """
+        Reads several ranges, possibly from different tabs, with a single `values.batchGet` request.
+
+        All ranges are validated up front. Ranges already in the values cache (or loaded by `preload`)
+        are served from memory, and only the rest are requested.
+
+        Args:
+            ranges (list[str]): Ranges in the `'Tab Name!A1:B2'` format, or just tab names for the whole tab.
+            value_render_option (ValueRenderOption, optional): How values are rendered. Defaults to FORMATTED_VALUE.
+            date_time_render_option (DateTimeRenderOption, optional): How dates are rendered when values
+                aren't formatted. Defaults to SERIAL_NUMBER.
+
+        Returns:
+            Response: On success, `data` is a list with the values of each range, in the same order as `ranges`
+                (a list of rows, a single value for single cells, or None for empty ranges).
+                `details['fetched']` counts the ranges actually requested to the API.
+
+        Example:
+            ```python
+            response = ss.batch_get(['Sales!A1:C10', 'Inventory!B2', 'Summary'])
+            sales, stock, summary = response.data
+            ```
+        """
+        function_name = 'Spreadsheet.batch_get'
+        ranges = list(ranges)
+        details = {
+            'ranges' : ranges,
+            'value_render_option' : value_render_option,
+            'date_time_render_option' : date_time_render_option,
+            'spreadsheet_info' : self._info_cache
+        }
+        if not ranges:
+            return Response.fail('No ranges to get.', function_name=function_name, details=details)
+        if value_render_option not in _VALUE_RENDER_OPTIONS:
+            return Response.fail(f'Args Error: Invalid value render option {value_render_option}', function_name=function_name, details=details)
+        if date_time_render_option not in _DATE_TIME_RENDER_OPTIONS:
+            return Response.fail(f'Args Error: Invalid date time render option {date_time_render_option}', function_name=function_name, details=details)
+
+        # Validando todos os ranges de uma vez (só a parte depois do nome da aba; sem '!' é a aba inteira).
+        cells = [rng.rpartition('!')[2] if '!' in rng else '' for rng in ranges]
+        invalid = [rng for rng, cell, ok in zip(ranges, cells, validate_xranges(cells)) if cell and not ok]
+        if invalid:
+            logger.warning('Invalid ranges: %s.', invalid)
+            return Response.fail(f'Invalid x Ranges: {invalid}.', function_name=function_name, details=details)
+
+        # Servindo o que já está em memória e pedindo só o resto.
+        keys = [('values', self.spreadsheet_id, rng, value_render_option, date_time_render_option) for rng in ranges]
+        results = {}
+        for key in dict.fromkeys(keys):
+            cached = self._prefetched.pop(key, None)
+            if cached is None:
+                cached = self.values_cache.get(key)
+            if cached is not None:
+                results[key] = cached
+        missing = [key for key in dict.fromkeys(keys) if key not in results]
+        details['fetched'] = len(missing)
+
+        if missing:
+            generation = self._values_generation
+            try:
+                request = self._values_service.batchGet(
+                    spreadsheetId = self.spreadsheet_id,
+                    ranges = [key[2] for key in missing],
+                    valueRenderOption = value_render_option,
+                    dateTimeRenderOption = date_time_render_option
+                )
+            except Exception as e:
+                return Response.fail(f'Error while building request: {e}', function_name=function_name, details=details)
+
+            response = self.client.execute(request)
+            if not response.ok:
+                if response.error:
+                    response.error.details = details
+                    response.error.function_name = function_name
+                return response
+
+            # A API devolve os valueRanges na mesma ordem dos ranges pedidos.
+            store = self._values_generation == generation # Houve escrita durante a leitura: não guarda o resultado
+            for key, value_range in zip(missing, response.data.get('valueRanges', [])): # type: ignore
+                results[key] = value_range
+                if store:
+                    self.values_cache.set(key, value_range)
+
+        data = [_unwrap_values(results[key], key[2]) if key in results else None for key in keys]
+        return Response.success(data = data, details = details)
+
+    def to_dfs(self, ranges:list[str], headers = [], dtype = None, dtype_backend = None,
+               value_render_option:ValueRenderOption = 'FORMATTED_VALUE') -> list[pd.DataFrame]:
+        """
+        Reads several ranges with a single `values.batchGet` request and returns one DataFrame per range.
+
+        Args:
+            ranges (list[str]): Ranges in the `'Tab Name!A1:B2'` format, or just tab names for the whole tab.
+            headers (list, optional): Column names used for every range. If not given, the first row of each range is used.
+            dtype (optional): dtype to cast the DataFrames to. Same as in `Sheet.to_df`.
+            dtype_backend (str, optional): Backend for `DataFrame.convert_dtypes`. Same as in `Sheet.to_df`.
+            value_render_option (ValueRenderOption, optional): Passed to `batch_get`. Defaults to FORMATTED_VALUE.
+
+        Returns:
+            list[pd.DataFrame]: One DataFrame per range, in the same order as `ranges`. If the read fails,
+                every DataFrame is empty.
+
+        Example:
+            ```python
+            sales, inventory = ss.to_dfs(['Sales!A1:D500', 'Inventory'])
+            ```
+        """
+        import pandas as pd
+        ranges = list(ranges)
+        response = self.batch_get(ranges, value_render_option = value_render_option)
+        if not response.ok:
+            logger.warning('Not possible to read ranges %s: %s. Returning empty dataframes instead.', ranges, response.error)
+            return [pd.DataFrame() for _ in ranges]
+        return [_values_frame(values, headers, dtype, dtype_backend) for values in response.data] # type: ignore
+
+    async def execute_batch_async(self) -> Response:
+        """
+        Awaitable version of `execute_batch`. The request runs in the client's thread pool,
+        so the event loop is free while it waits for the API.
+
+        Returns:
+            Response: Same as `execute_batch`.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.client.executor, self.execute_batch)
+
+    async def gather_values(self, requests:list[tuple[Sheet | str, str]], **kwargs) -> list[Response]:
+        """
+        Reads several ranges concurrently and returns their responses in the same order.
+
+        Each read is a regular `Sheet.get_values` call running in the client's thread pool,
+        so caching, request coalescing and the rate limiter all still apply. The number of
+        reads in flight is bounded by the pool size (`client.MAX_WORKERS`).
+
+        Args:
+            requests (list[tuple[Sheet | str, str]]): Pairs of tab (Sheet object or tab name)
+                and range, e.g. `[('Sales', 'A1:C10'), (inventory_tab, '')]`.
+            **kwargs: Passed to every `get_values` call (e.g. `value_render_option`).
+
+        Returns:
+            list[Response]: One Response per request. Unknown tabs get a failed Response.
+
+        Example:
+            ```python
+            responses = await ss.gather_values([('Sales', 'A1:C10'), ('Inventory', '')])
+
+            # From synchronous code:
+            responses = asyncio.run(ss.gather_values([('Sales', 'A1:C10'), ('Inventory', '')]))
+            ```
+        """
+        async def read(sheet, rng):
+            if isinstance(sheet, str):
+                name = sheet
+                sheet = self.get_sheet(name)
+                if sheet is None:
+                    return Response.fail(f'Sheet not found: {name}.', function_name='Spreadsheet.gather_values',
+                                         details={'sheet' : name, 'rng' : rng})
+            return await sheet.get_values_async(rng, **kwargs)
+
+        return list(await asyncio.gather(*(read(sheet, rng) for sheet, rng in requests)))
+
     def get_info(self) -> dict:
         """
         Returns a simple dictionary containing the Spreadsheet's info. 
@@ -351,26 +983,6 @@ class Spreadsheet:
             'sheets' : self.sheets_info
         }
         
-    def _get_dets(self, locals:dict):
-        """
-        Internal method to create details about a method execution, mostly
-        to attach to Response type objects.
-
-        Receives a dictionary of parameters, generally representing the local namespace,
-        and returns an enriched and cleaned dictionary with the Spreadsheet's info.
-
-        Args:
-            locals (dict): dict with runtime parameters used to build the details dictionary.
-        
-        Returns:
-            deets (dict): data received enriched with aditional Spreadsheet information. 
-        """
-        deets = locals.copy()
-        if 'self' in deets:
-            del deets['self']
-        deets['spreadsheet_info'] = self.get_info()
-        return deets
-
     def __getitem__(self, sheet: int | str):
         """
         Dunder method to implement subscript syntax for both get_sheet and get_sheet_by_id.
@@ -446,6 +1058,10 @@ class Sheet:
         tab['C3:D4'] = values
         ```
     """
+    __slots__ = ('name', '_name_prefix', 'id', 'spreadsheet_id', 'service', 'client',
+                 'row_count', 'column_count', 'parent_spreadsheet', '_info_cache',
+                 '_values_service')
+
     def __init__(self,
                  name:str,
                  id:int,
@@ -456,15 +1072,21 @@ class Sheet:
                  column_count:int = 0):
         
         self.name = name
+        self._name_prefix = f'{name}!'
         self.id = id
         self.spreadsheet_id = parent_spreadsheet.spreadsheet_id
         self.service = service
+        self._values_service = parent_spreadsheet._values_service
         self.client = client
         self.row_count = row_count
         self.column_count = column_count
         self.parent_spreadsheet = parent_spreadsheet
+        self._info_cache = self.get_info() # Anexado aos details das respostas; refeito em refresh_metadata
 
-    def get_values(self, rng:str = '') -> Response:
+    def get_values(self, rng:str = '',
+                   value_render_option:ValueRenderOption = 'FORMATTED_VALUE',
+                   date_time_render_option:DateTimeRenderOption = 'SERIAL_NUMBER',
+                   ttl:float | None = None) -> Response:
         """
         Method to access the sheet's values. If range is not specified, returns the whole content if the sheet.
         Returns a Response object with the values.
@@ -473,6 +1095,15 @@ class Sheet:
         Args: 
             rng(str, optional): Range in the Excel Format. E.g `A1:Q22`, `A:Q`, `C32`.
                 If not specified, the values for the whole tab will be returned. 
+            value_render_option (ValueRenderOption, optional): How values are rendered. Defaults to
+                FORMATTED_VALUE (as shown in the UI). Use UNFORMATTED_VALUE for numeric workloads:
+                numbers come back as numbers and the payload is smaller.
+            date_time_render_option (DateTimeRenderOption, optional): How dates are rendered when
+                values aren't formatted. Defaults to SERIAL_NUMBER.
+            ttl (float, optional): Seconds this range may be served from memory, overriding the
+                Spreadsheet's `cache_ttl` for this call: a cached copy older than that is read again,
+                and the new result is kept for that long. Use a long ttl for static ranges such as
+                header rows, or 0 to always read from the API. Defaults to None (use `cache_ttl`).
 
         Returns:
             Response: Response object with the sheet's data, if succeded, or error information, if failed.
@@ -485,6 +1116,11 @@ class Sheet:
             If only a single cell is specified, the Response.data is a singular value.
             All other times, it contains a list of lists or None.
 
+            If the parent Spreadsheet was created with `cache_ttl` > 0, or `ttl` > 0 is given, repeated
+            reads of the same range within that window are served from memory (`details['cached']` is True).
+            The cached lists are shared between calls, so don't mutate them in place.
+            Any write through the library drops the cached values.
+
         Example:
             ```python
             # Requesting a range
@@ -503,54 +1139,105 @@ class Sheet:
             ```
         """
         
-        details = self._get_dets(locals())
+        details = {
+            'rng' : rng,
+            'value_render_option' : value_render_option,
+            'date_time_render_option' : date_time_render_option,
+            'ttl' : ttl,
+            'sheet_info' : self._info_cache
+        }
         function_name = 'Sheet.get_values'
 
+        if value_render_option not in _VALUE_RENDER_OPTIONS:
+            return Response.fail(f'Args Error: Invalid value render option {value_render_option}', function_name=function_name, details=details)
+        if date_time_render_option not in _DATE_TIME_RENDER_OPTIONS:
+            return Response.fail(f'Args Error: Invalid date time render option {date_time_render_option}', function_name=function_name, details=details)
+
         # Validando e formatando range
-        if rng:
-            is_valid_range = validate_xrange(rng)
-            if not is_valid_range:
-                print(f'Invalid range: {rng}.')
-                return Response.fail(f'Invalid x Range: {rng}.', function_name=function_name, details = details)
-            if '!' in rng:
-                rng = rng.split('!')[-1]
-            request_range = f'{self.name}!{rng}'
-        else:
-            request_range = f'{self.name}'
+        request_range = self._request_range(rng)
+        if request_range is None:
+            return Response.fail(f'Invalid x Range: {rng}.', function_name=function_name, details = details)
 
-        # Criando requisição
-        try:
-            request = self.service.values().get( 
-                spreadsheetId = self.spreadsheet_id,
-                range = request_range
-            )
-        except Exception as e:
-            return Response.fail(f'Error while building request: {e}', function_name=function_name, details=details)
-        
-        # Fazendo requisição
-        response = self.client.execute(request)
+        return self._get_values_unchecked(request_range, value_render_option, date_time_render_option, ttl, details)
+
+    def _get_values_unchecked(self, request_range:str,
+                              value_render_option:ValueRenderOption,
+                              date_time_render_option:DateTimeRenderOption,
+                              ttl:float | None,
+                              details:dict) -> Response:
+        """
+        Body of `get_values` for a range that was already validated and qualified with the tab name.
+        """
+        function_name = 'Sheet.get_values'
+        key = ('values', self.spreadsheet_id, request_range, value_render_option, date_time_render_option)
+        cache = self.parent_spreadsheet.values_cache
+        cached = self.parent_spreadsheet._prefetched.pop(key, None)
+        if cached is None and ttl != 0:
+            cached = cache.get(key, ttl = ttl)
+        if cached is not None:
+            details['cached'] = True
+            response = Response.success(data = cached)
+        else:
+            # Criando requisição
+            try:
+                request = self._values_service.get( 
+                    spreadsheetId = self.spreadsheet_id,
+                    range = request_range,
+                    valueRenderOption = value_render_option,
+                    dateTimeRenderOption = date_time_render_option
+                )
+            except Exception as e:
+                return Response.fail(f'Error while building request: {e}', function_name=function_name, details=details)
+            
+            # Fazendo requisição. Chamadas simultâneas para o mesmo range compartilham a mesma resposta,
+            # então trabalhamos em cópias para não alterar o objeto dos outros chamadores. A geração entra
+            # na chave para que uma leitura feita depois de uma escrita não pegue carona numa anterior.
+            generation = self.parent_spreadsheet._values_generation
+            response = copy.copy(self.client.flights.do(key + (generation,), lambda: self.client.execute(request)))
+            if response.ok and response.data is not None and self.parent_spreadsheet._values_generation == generation:
+                cache.set(key, response.data, ttl)
         
         # Resolvendo resposta da requisição
         if response.ok:
             details['range'] = request_range
             if response.data:
-                response.data = response.data.get('values')
-                if is_cell(rng) and isinstance(response.data, list) and len(response.data[0]) == 1:
-                    response.data = response.data[0][0]
+                response.data = _unwrap_values(response.data, request_range)
 
             response.details = details
 
         else:
             if response.error:
+                response.error = copy.copy(response.error)
                 response.error.details = details
                 response.error.function_name = function_name
  
         return response
 
+    async def get_values_async(self, rng:str = '', **kwargs) -> Response:
+        """
+        Awaitable version of `get_values`. The request runs in the client's thread pool,
+        so many reads can be awaited together (see `Spreadsheet.gather_values`).
+
+        Args:
+            rng (str, optional): Range in the Excel format. Defaults to the whole tab.
+            **kwargs: Other `get_values` arguments.
+
+        Returns:
+            Response: Same as `get_values`.
+
+        Example:
+            ```python
+            header, body = await asyncio.gather(tab.get_values_async('1:1'), tab.get_values_async('A2:G100'))
+            ```
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.client.executor, functools.partial(self.get_values, rng, **kwargs))
+
     def append_values(self, values: list[list], 
                       rng:str = '',
                       input_option: InputOption = 'USER_ENTERED',
-                      insert_data_option: InsertDataOption = 'INSERT_ROWS') -> Response:
+                      insert_data_option: InsertDataOption = 'INSERT_ROWS',
+                      chunk_size: int = APPEND_CHUNK_ROWS) -> Response:
         """
         This method inserts new data into the Spreadsheet's tab, starting at the specified range.
 
@@ -569,6 +1256,8 @@ class Sheet:
             input_option (InputOption, optional): Input mode, defaulted to USER_ENTERED.
             insert_data_option (InsertDataOption, optional): How to append, either by inserting new rows, or
                 by overwritting blank cells.
+            chunk_size (int, optional): Maximum rows per request. Larger value lists are sent as consecutive
+                appends of this size, which keeps each request body small. Defaults to 5000.
 
         Returns:
             Response: response object with the status of the request. Response.data defaults to None.
@@ -583,6 +1272,9 @@ class Sheet:
             A quick way to fix types is valling `values = [[str(val) for val in row] for row in values]`, 
             which converts every value to str.
 
+            When the values are split in chunks and one of them fails, the previous chunks stay written.
+            `details['appended_rows']` tells how many rows made it.
+
         Examples:
             ```python
             # appending values to a tab
@@ -598,7 +1290,13 @@ class Sheet:
         """
         
         # Registrando dados para validação depois.
-        details = self._get_dets(locals())
+        details = {
+            'rng' : rng,
+            'input_option' : input_option,
+            'insert_data_option' : insert_data_option,
+            'value_rows' : len(values) if values else 0, # Só o tamanho: a lista de valores pode ser enorme.
+            'sheet_info' : self._info_cache
+        }
         function_name = 'Sheet.append_values'
 
         # Validando valores:
@@ -606,58 +1304,56 @@ class Sheet:
             return Response.fail(f'No values to insert.', function_name=function_name, details = details)
 
         # Validando e formatando range.
-        if rng:
-            is_valid_range = validate_xrange(rng)
-            if not is_valid_range:
-                print(f'Invalid range: {rng}.')
-                return Response.fail(f'Invalid x Range: {rng}.', function_name=function_name, details = details)
-            if '!' in rng:
-                rng = rng.split('!')[-1]
-            request_range = f'{self.name}!{rng}'
-        else:
-            request_range = f'{self.name}'
+        request_range = self._request_range(rng)
+        if request_range is None:
+            return Response.fail(f'Invalid x Range: {rng}.', function_name=function_name, details = details)
 
         # Validando as outras opções:
-        if input_option not in get_args(InputOption):
+        if input_option not in _INPUT_OPTIONS:
             error_msg = f'Arg Error: Invalid input option: {input_option}.'
-            print(error_msg)
+            logger.warning('Arg Error: Invalid input option: %s.', input_option)
             return Response.fail(error_msg, function_name=function_name, details=details)
-        if insert_data_option not in get_args(InsertDataOption):
+        if insert_data_option not in _INSERT_OPTIONS:
             error_msg = f'Arg Error: Invalid insert data option: {insert_data_option}.'
-            print(error_msg)
+            logger.warning('Arg Error: Invalid insert data option: %s.', insert_data_option)
             return Response.fail(error_msg, function_name=function_name, details=details)
        
-        # Preparando requisição
-        body = {'values':values}
-        
-        try:
-            request = self.service.values().append( 
-                spreadsheetId = self.spreadsheet_id,
-                range = request_range,
-                valueInputOption = input_option,
-                insertDataOption = insert_data_option,
-                body = body
-            )
-        except Exception as e:
-            return Response.fail(f'Error while building request: {e}', function_name=function_name, details=details)
+        # Enviando em partes: cada append encontra o fim da tabela já com as partes anteriores.
+        chunk_size = max(int(chunk_size), 1)
+        details['appended_rows'] = 0
+        for start in range(0, len(values), chunk_size):
+            chunk = values if chunk_size >= len(values) else values[start:start + chunk_size]
+            try:
+                request = self._values_service.append( 
+                    spreadsheetId = self.spreadsheet_id,
+                    range = request_range,
+                    valueInputOption = input_option,
+                    insertDataOption = insert_data_option,
+                    body = {'values' : chunk}
+                )
+            except Exception as e:
+                return Response.fail(f'Error while building request: {e}', function_name=function_name, details=details)
+
+            response = self.client.execute(request)
+            self.parent_spreadsheet._invalidate_values()
+            
+            if not response.ok:
+                if response.error:
+                    response.error.details = details
+                    response.error.function_name = function_name
+                return response
 
-        response = self.client.execute(request)
-        
-        if response.ok:
+            details['appended_rows'] += len(chunk)
             result = response.data
             if result:
                 details['range'] = request_range
-                details['table_range'] = result.get('tableRange')
+                details.setdefault('table_range', result.get('tableRange')) # Tabela antes do primeiro append
                 if 'updates' in result:
                     details['updated_range'] = result['updates'].get('updatedRange')
-            response.data = None
-            response.details = details
-            return response
-        else:
-            if response.error:
-                response.error.details = details
-                response.error.function_name = function_name
-            return response
+
+        response.data = None
+        response.details = details
+        return response
 
     def clear_cells(self, rng:str = '') -> Response:
         """
@@ -682,23 +1378,25 @@ class Sheet:
             tab.clear_cells()
             ```
         """
-        details = self._get_dets(locals())
+        details = {'rng' : rng, 'sheet_info' : self._info_cache}
         function_name = 'Sheet.append_values'
 
-        if rng:
-            is_valid_range = validate_xrange(rng)
-            if not is_valid_range:
-                print(f'Invalid range: {rng}.')
-                return Response.fail(f'Invalid x Range: {rng}.', function_name=function_name, details = details)
-            if '!' in rng:
-                rng = rng.split('!')[-1]
-            request_range = f'{self.name}!{rng}'
-        else:
-            request_range = f'{self.name}'
+        request_range = self._request_range(rng)
+        if request_range is None:
+            return Response.fail(f'Invalid x Range: {rng}.', function_name=function_name, details = details)
+
+        if self.parent_spreadsheet._value_batch_option is not None:
+            pending = self.parent_spreadsheet._flush_before_value_write(clear = True)
+            if pending is not None:
+                return pending
+            self.parent_spreadsheet.batch_clear_ranges.append(request_range)
+            details['range'] = request_range
+            details['prepared'] = True
+            return Response.success(details = details)
 
         # Construíndo a request:
         try:
-            request = self.service.values().clear( 
+            request = self._values_service.clear( 
                 spreadsheetId = self.spreadsheet_id,
                 range = request_range
             )
@@ -706,6 +1404,7 @@ class Sheet:
             return Response.fail(f'Error while building request: {e}', function_name=function_name, details=details)
         
         response = self.client.execute(request)
+        self.parent_spreadsheet._invalidate_values()
 
         if response.ok:
             result = response.data
@@ -721,34 +1420,108 @@ class Sheet:
                 response.error.function_name = function_name
             return response
 
+    def begin_batch(self, value_input_option:InputOption = 'USER_ENTERED'):
+        """
+        Starts queueing value writes instead of sending them right away.
+
+        While batching, `update`, `update_cell` (and the subscript assignment), `update_many`,
+        `clear_cells`, `autofill_drag` and `delete_rows` only append their request to the parent
+        Spreadsheet's queues and return a successful `Response` with `details['prepared'] = True`.
+        Nothing is sent until `flush_batch()` is called, except when a write would otherwise
+        be applied out of call order (a clear after queued updates, or a value write after a
+        queued structural request): then everything queued so far is sent first.
+
+        The queue belongs to the parent Spreadsheet, so writes to other tabs of the same
+        Spreadsheet are queued as well.
+
+        Args:
+            value_input_option (InputOption, optional): Input mode used by the whole batch.
+                Writes that don't pass their own mode use this one; explicitly passing a different
+                mode fails while the batch is open.
+        """
+        self.parent_spreadsheet._value_batch_option = value_input_option
+
+    def flush_batch(self) -> Response:
+        """
+        Stops batching and sends every queued write in as few requests as possible.
+
+        Returns:
+            Response: Result of `Spreadsheet.execute_value_batch`, or of `Spreadsheet.execute_batch`
+                if structural requests (`autofill_drag`, `delete_rows`) were queued too. Successful,
+                with empty details, if nothing was queued. On failure, the writes that weren't sent
+                are dropped from the queues and listed in `error.details['unsent']`.
+
+        Notes:
+            `append_values` isn't queued: the API has no batched append for values, so it is
+            sent right away even while batching.
+        """
+        try:
+            return self.parent_spreadsheet._flush_batches()
+        finally:
+            self.parent_spreadsheet._value_batch_option = None
+
+    def batch(self, value_input_option:InputOption = 'USER_ENTERED') -> BatchContext:
+        """
+        Context manager version of `begin_batch`/`flush_batch`. Same as `Spreadsheet.batch()`
+        on the parent Spreadsheet.
+
+        The queued writes are flushed when the block exits normally, and discarded if it
+        raises. The flush result is stored in the context's `response` attribute.
+
+        Args:
+            value_input_option (InputOption, optional): Input mode used by the whole batch.
+
+        Returns:
+            BatchContext: the context manager.
+
+        Example:
+            ```python
+            with tab.batch() as batch:
+                for row in range(2, 100):
+                    tab[f'C{row}'] = f'=A{row}*B{row}'
+
+            if not batch.response.ok:
+                print(batch.response.error)
+            ```
+        """
+        return BatchContext(self.parent_spreadsheet, value_input_option)
+
     def update(self,
                values:list[list],
                rng:str = 'A1', 
-               value_input_option:InputOption = 'USER_ENTERED',
+               value_input_option:InputOption | None = None,
                major_dimension:MajorDimension = 'ROWS'):
-        "Função que atualiza células da planilha."
+        "Função que atualiza células da planilha. Sem value_input_option, usa o do batch aberto (ou USER_ENTERED)."
         
-        details = self._get_dets(locals())
+        batch_option = self.parent_spreadsheet._value_batch_option
+        if value_input_option is None:
+            value_input_option = batch_option or 'USER_ENTERED'
+        details = {
+            'rng' : rng,
+            'value_input_option' : value_input_option,
+            'major_dimension' : major_dimension,
+            'value_rows' : len(values) if values else 0,
+            'sheet_info' : self._info_cache
+        }
         function_name = 'Sheet.update'
 
         if rng:
             is_valid_range = validate_xrange(rng)
             if not is_valid_range:
-                print(f'Invalid range: {rng}.')
+                logger.warning('Invalid range: %s.', rng)
                 return Response.fail(f'Invalid x Range: {rng}.', function_name=function_name, details = details)
-            if '!' in rng:
-                rng = rng.split('!')[-1]
+            rng = rng.rpartition('!')[2]
             if ':' not in rng:
                 rng = get_values_delta(rng, values)
-            request_range = f'{self.name}!{rng}'
+            request_range = self._qualify(rng)
         else:
             return Response.fail(f'No range specified.', function_name=function_name, details = details)
 
         # Validando parâmetros adicionais:
-        if major_dimension not in get_args(MajorDimension):
+        if major_dimension not in _MAJOR_DIMENSIONS:
             error_msg = f'Args Error: Invalid major dimension {major_dimension}'
             return Response.fail(error_msg, function_name = function_name, details = details)
-        if value_input_option not in get_args(InputOption):
+        if value_input_option not in _INPUT_OPTIONS:
             error_msg = f'Args Error: Invalid input option {value_input_option}'
             return Response.fail(error_msg, function_name = function_name, details = details)
         
@@ -756,9 +1529,22 @@ class Sheet:
             'values' : values,
             'majorDimension' : major_dimension
         }
+
+        if batch_option is not None:
+            if value_input_option != batch_option:
+                error_msg = f'Args Error: Input option {value_input_option} differs from the batch input option {batch_option}'
+                return Response.fail(error_msg, function_name = function_name, details = details)
+            pending = self.parent_spreadsheet._flush_before_value_write()
+            if pending is not None:
+                return pending
+            body['range'] = request_range
+            self.parent_spreadsheet.batch_value_requests.append(body)
+            details['range'] = request_range
+            details['prepared'] = True
+            return Response.success(details = details)
         
         try:
-            request = self.service.values().update(
+            request = self._values_service.update(
                 range = request_range,
                 spreadsheetId = self.spreadsheet_id,
                 body = body, 
@@ -768,15 +1554,14 @@ class Sheet:
             return Response.fail(f'Error while building request: {e}', function_name=function_name, details=details)
 
         response = self.client.execute(request)
+        self.parent_spreadsheet._invalidate_values()
 
         if response.ok:
             result = response.data
             if result:
                 details['range'] = request_range
-                details['updated_range'] = result.get('updatedRange')
-                details['updated_cells'] = result.get('updatedCells')
-                details['updated_rows'] = result.get('updatedRows')
-                details['updated_columns'] = result.get('updatedColumns')
+                # Um único update; campos que a API não mandou ficam de fora.
+                details.update({name : result[key] for key, name in _UPDATE_RESULT_FIELDS if key in result})
             response.data = None
             response.details = details
             return response
@@ -786,23 +1571,113 @@ class Sheet:
                 response.error.function_name = function_name
             return response
 
-    def update_cell(self, cell:str, value):
-        
-        details = self._get_dets(locals())
+    def update_many(self,
+                    updates:list[tuple[str, list[list]]],
+                    value_input_option:InputOption | None = None,
+                    major_dimension:MajorDimension = 'ROWS') -> Response:
+        """
+        Writes several ranges of this tab with a single `values.batchUpdate` request.
+
+        Same rules as `update` for each range: a single start cell is widened to the size
+        of its values. Inside a batch (`batch()`), the writes are queued instead.
+
+        Args:
+            updates (list[tuple[str, list[list]]]): Pairs of range and values, e.g.
+                `[('A1', [['Total']]), ('C2:D3', [[1, 2], [3, 4]])]`.
+            value_input_option (InputOption, optional): Input mode for every range. Defaults to the open
+                batch's input mode, or USER_ENTERED outside a batch.
+            major_dimension (MajorDimension, optional): Major dimension of every values list. Defaults to ROWS.
+
+        Returns:
+            Response: Response object with the status of the request. Fails without sending anything
+                if any range is invalid or has no values.
+
+        Example:
+            ```python
+            tab.update_many([(f'C{row}', [[f'=A{row}*B{row}']]) for row in range(2, 100)])
+            ```
+        """
+        batch_option = self.parent_spreadsheet._value_batch_option
+        if value_input_option is None:
+            value_input_option = batch_option or 'USER_ENTERED'
+        details = {
+            'ranges' : len(updates),
+            'value_input_option' : value_input_option,
+            'major_dimension' : major_dimension,
+            'sheet_info' : self._info_cache
+        }
+        function_name = 'Sheet.update_many'
+
+        if not updates:
+            return Response.fail('No values to update.', function_name = function_name, details = details)
+        if major_dimension not in _MAJOR_DIMENSIONS:
+            return Response.fail(f'Args Error: Invalid major dimension {major_dimension}', function_name = function_name, details = details)
+        if value_input_option not in _INPUT_OPTIONS:
+            return Response.fail(f'Args Error: Invalid input option {value_input_option}', function_name = function_name, details = details)
+
+        prefix = self._name_prefix
+        data = []
+        for rng, values in updates:
+            if not rng or not validate_xrange(rng):
+                logger.warning('Invalid range: %s.', rng)
+                return Response.fail(f'Invalid x Range: {rng}.', function_name = function_name, details = details)
+            if not values or not values[0]:
+                return Response.fail(f'No values to insert in range {rng}.', function_name = function_name, details = details)
+            rng = rng.rpartition('!')[2]
+            if ':' not in rng:
+                rng = get_values_delta(rng, values)
+            data.append({'range' : prefix + rng, 'values' : values, 'majorDimension' : major_dimension})
+
+        if batch_option is not None:
+            if value_input_option != batch_option:
+                error_msg = f'Args Error: Input option {value_input_option} differs from the batch input option {batch_option}'
+                return Response.fail(error_msg, function_name = function_name, details = details)
+            pending = self.parent_spreadsheet._flush_before_value_write()
+            if pending is not None:
+                return pending
+            self.parent_spreadsheet.batch_value_requests.extend(data)
+            details['prepared'] = True
+            return Response.success(details = details)
+
+        try:
+            request = self._values_service.batchUpdate(
+                spreadsheetId = self.spreadsheet_id,
+                body = {'valueInputOption' : value_input_option, 'data' : data}
+            )
+        except Exception as e:
+            return Response.fail(f'Error while building request: {e}', function_name=function_name, details=details)
+
+        response = self.client.execute(request)
+        self.parent_spreadsheet._invalidate_values()
+
+        if response.ok:
+            result = response.data
+            if result:
+                details['updated_cells'] = result.get('totalUpdatedCells')
+                details['updated_rows'] = result.get('totalUpdatedRows')
+                details['updated_columns'] = result.get('totalUpdatedColumns')
+            response.data = None
+            response.details = details
+        elif response.error:
+            response.error.details = details
+            response.error.function_name = function_name
+        return response
+
+    def update_cell(self, cell:str, value, value_input_option:InputOption | None = None):
+        "Função que atualiza uma única célula. Sem value_input_option, usa o do batch aberto (ou USER_ENTERED)."
+        details = {'cell' : cell, 'value' : value, 'sheet_info' : self._info_cache}
         function_name = 'Sheet.update_cell'
 
         if not is_cell(cell):
-            print(f'Invalid cell format: {cell}')
+            logger.warning('Invalid cell format: %s', cell)
             return Response.fail(f'Invalid cell format: {cell}', function_name=function_name, details=details)
         
         
-        response = self.update(rng = cell, values = [[value]])
+        response = self.update(rng = cell, values = [[value]], value_input_option = value_input_option)
 
         if response.ok:
-            updated_range = response.details.get('updatedRange') # type: ignore
-            response.details = details
-            response.details['updated_range'] = updated_range
-            response.details['cell'] = cell
+            # Mantém os details do update (range, prepared, ...) e acrescenta os da célula.
+            response.details.update(details) # type: ignore
         elif response.error:
             response.error.details = details
             response.error.function_name = function_name
@@ -810,18 +1685,23 @@ class Sheet:
     
     def autofill_drag(self, source_range:str, drag_distance:int, prepare = False, dimension:MajorDimension = 'ROWS'):
 
-        details = self._get_dets(locals())
+        details = {
+            'source_range' : source_range,
+            'drag_distance' : drag_distance,
+            'prepare' : prepare,
+            'dimension' : dimension,
+            'sheet_info' : self._info_cache
+        }
         function_name = 'Sheet.autofill_drag'
 
         if drag_distance < 0:
             return Response.fail(f'Invalid drag distance: {drag_distance}.', function_name=function_name, details = details)
         
-        if dimension not in get_args(MajorDimension):
+        if dimension not in _MAJOR_DIMENSIONS:
             return Response.fail(f'Invalid dimension: {dimension}.', function_name=function_name, details = details)
 
         if source_range:
-            if '!' in source_range:
-                source_range = source_range.split('!')[-1]
+            source_range = source_range.rpartition('!')[2]
             grid_range = xrange_to_grid_range(source_range)
             if not grid_range:
                 return Response.fail(f'Invalid range.', function_name=function_name, details = details)
@@ -841,9 +1721,10 @@ class Sheet:
             }
         }
         
-        details['autofill_request'] = autofill_request
+        if self.client.details_enabled:
+            details['autofill_request'] = autofill_request
 
-        if prepare:
+        if prepare or self.parent_spreadsheet._value_batch_option is not None:
             details['prepared'] = True
             self.parent_spreadsheet.batch_requests.append(autofill_request)
             return Response.success(details = details)
@@ -858,6 +1739,7 @@ class Sheet:
             return Response.fail(f'Error while building request: {e}', function_name=function_name, details=details)
         
         response = self.client.execute(request)
+        self.parent_spreadsheet._invalidate_values()
 
         if response.ok:
             response.details = details
@@ -871,12 +1753,17 @@ class Sheet:
     def delete_rows(self, rng:str = '', start_row:int =-1, end_row:int=-1, prepare = False):
         "Função que deleta linhas da planilha. Pode receber tanto range, quanto pode receber start_row e end_row (base 1 inclusivo)"
         
-        details = self._get_dets(locals())
+        details = {
+            'rng' : rng,
+            'start_row' : start_row,
+            'end_row' : end_row,
+            'prepare' : prepare,
+            'sheet_info' : self._info_cache
+        }
         function_name = 'Sheet.delete_rows'
 
         if rng:
-            if '!' in rng:
-                rng = rng.split('!')[-1]
+            rng = rng.rpartition('!')[2]
             grid_range = xrange_to_grid_range(rng)
             if not grid_range:
                 return Response.fail(f'Invalid range: {rng}', function_name=function_name, details=details)
@@ -904,9 +1791,10 @@ class Sheet:
             }
         }
 
-        details['delete_request'] = delete_request # Telemetria
+        if self.client.details_enabled:
+            details['delete_request'] = delete_request # Telemetria
 
-        if prepare:
+        if prepare or self.parent_spreadsheet._value_batch_option is not None:
             details['prepared'] = True
             self.parent_spreadsheet.batch_requests.append(delete_request)
             return Response.success(details = details)    
@@ -922,8 +1810,15 @@ class Sheet:
             return Response.fail(f'Error while building request: {e}', function_name=function_name, details=details)
 
         response = self.client.execute(request)
+        self.parent_spreadsheet._invalidate_values()
 
         if response.ok:
+            # Atualizando a contagem de linhas localmente, sem buscar os metadados de novo.
+            self.row_count = max(self.row_count - (end_index - start_index), 0)
+            self._info_cache = self.get_info()
+            sheet_info = self.parent_spreadsheet.sheets_info.get(self.name)
+            if sheet_info is not None:
+                sheet_info['row_count'] = self.row_count
             response.details = details
             response.data = None
         elif response.error:
@@ -932,19 +1827,44 @@ class Sheet:
         return response
 
     def refresh_metadata(self):
-        self.parent_spreadsheet.refresh_metadata()
-        metadata = dict()
-        for sheet_info in self.parent_spreadsheet.sheets_info.values():
-            if sheet_info['sheet_id'] == self.id or sheet_info['title'] == self.name:
-                metadata = sheet_info
-                break
+        """
+        Updates the tab's name and dimensions from the parent Spreadsheet's metadata.
+
+        The parent metadata is only re-fetched if it's older than its `metadata_ttl`,
+        so successive calls share a single API request.
+        """
+        parent = self.parent_spreadsheet
+        parent.refresh_metadata(force = False)
+        name = parent._id_to_name.get(self.id, self.name)
+        metadata = parent.sheets_info.get(name)
         if metadata:
             self.name = metadata['title']
+            self._name_prefix = f'{self.name}!'
             self.id = metadata['sheet_id']
             self.row_count = metadata['row_count']
             self.column_count = metadata['column_count']
+            self._info_cache = self.get_info()
         else:
-            print(f'Não foi possível localizar metadados da aba {self.name}. Possivelmente foi deletada.')
+            logger.warning('Não foi possível localizar metadados da aba %s. Possivelmente foi deletada.', self.name)
+
+    def _qualify(self, rng:str) -> str:
+        """
+        Builds the API range for this tab: `'Tab Name!A1:B2'`, or just the tab name if `rng` is empty.
+        Any sheet name already present in `rng` is replaced by this tab's.
+        """
+        if not rng:
+            return self.name
+        return self._name_prefix + rng.rpartition('!')[2]
+
+    def _request_range(self, rng:str) -> str | None:
+        """
+        Validates `rng` and qualifies it with this tab's name, in one step.
+        Returns None (and logs a warning) if the range is invalid. An empty `rng` means the whole tab.
+        """
+        if rng and not validate_xrange(rng):
+            logger.warning('Invalid range: %s.', rng)
+            return None
+        return self._qualify(rng)
 
     def __str__(self):
         return f'Sheet Object "{self.name}"; Id = {self.id}; Parent Spreadsheet = {self.parent_spreadsheet.name}; Rows = {self.row_count}; Columns = {self.column_count}'
@@ -958,13 +1878,6 @@ class Sheet:
             'parent_spreadsheet': self.parent_spreadsheet.name
         }
 
-    def _get_dets(self, locals:dict) -> dict:
-        deets = locals.copy()
-        if 'self' in deets:
-            del deets['self']
-        deets['sheet_info'] = self.get_info()
-        return deets
-    
     def __getitem__(self, rng) -> Response:
         result = self.get_values(rng)
         if result.data:
@@ -973,30 +1886,202 @@ class Sheet:
             return result
     
     def __setitem__(self, rng, new_value) -> Response:
-        if is_cell(rng) and not isinstance(new_value, list):
-            return self.update_cell(cell = rng, value = new_value)
+        # Listas e tuplas vão direto para update; escalares para update_cell, que já valida a célula (uma checagem só).
+        if isinstance(new_value, (list, tuple)):
+            response = self.update(rng = rng, values = new_value)
         else:
-            return self.update(rng = rng, values = new_value)
+            response = self.update_cell(cell = rng, value = new_value)
+        # A atribuição descarta o retorno: sem este log, uma escrita recusada passaria em silêncio.
+        if not response.ok:
+            logger.warning('Assignment to %s failed: %s', rng, response.error.message if response.error else None)
+        return response
         
+    def transform(self, fn:Callable[[pd.DataFrame], pd.DataFrame], rng:str = '',
+                  value_input_option:InputOption | None = None) -> Response:
+        """
+        Reads a range as a DataFrame, applies `fn` to it and writes back only the cells that changed.
+
+        The first row of the range is used as the header, as in `to_df`. The result of `fn` is compared
+        cell by cell with what was read (header included), and the changed cells are sent in a single
+        `values.batchUpdate` (see `update_many`), grouped in horizontal runs. Cells that the new frame
+        no longer covers (dropped rows or columns) are blanked. Cells whose value didn't change are
+        not rewritten.
+
+        Cells are compared by their formatted value, so a formula cell whose value changes is overwritten
+        with the plain new value. That includes rows that `fn` drops, inserts or reorders: every row
+        after the change shifts, and its formulas are replaced by values.
+
+        The frame is as wide as the header row. Data rows are padded or cut to that width, and cells
+        to the right of the last header are never touched.
+
+        This replaces the usual read / clear / rewrite round trip with one read and one write, and
+        spends write quota only on what actually changed.
+
+        Args:
+            fn (Callable[[pd.DataFrame], pd.DataFrame]): Function receiving the current data and returning
+                the new one. It may modify the frame in place and return it.
+            rng (str, optional): Range to transform, in the Excel format. Defaults to the whole tab.
+            value_input_option (InputOption, optional): Input mode for the written cells. Defaults to the open
+                batch's input mode, or USER_ENTERED outside a batch.
+
+        Returns:
+            Response: The read's Response if it failed, otherwise the write's Response.
+                `details['changed_cells']` counts the cells written; when nothing changed, no write
+                request is sent.
+
+        Example:
+            ```python
+            def apply_discount(df):
+                df['Price'] = (df['Price'].astype(float) * 0.9).round(2)
+                return df
+
+            tab.transform(apply_discount, 'A1:D200')
+            ```
+        """
+        import pandas as pd
+        function_name = 'Sheet.transform'
+        response = self.get_values(rng, value_render_option = 'FORMATTED_VALUE')
+        if not response.ok:
+            return response
+        old = response.data if isinstance(response.data, list) else ([[response.data]] if response.data is not None else [])
+
+        headers = old[0] if old else []
+        # A API corta células vazias no fim das linhas (inclusive do cabeçalho): alinha tudo à largura do cabeçalho.
+        width = len(headers)
+        old = [headers] + [row[:width] + [''] * (width - len(row)) for row in old[1:]]
+        frame = pd.DataFrame.from_records(old[1:], columns = headers) if headers else pd.DataFrame()
+        details = {'rng' : rng, 'sheet_info' : self._info_cache}
+        try:
+            new_frame = fn(frame)
+        except Exception as e:
+            return Response.fail(f'Error in transform function: {e}', function_name = function_name, details = details)
+        if not isinstance(new_frame, pd.DataFrame):
+            return Response.fail(f'Transform function must return a DataFrame, got {type(new_frame).__name__}.',
+                                 function_name = function_name, details = details)
+        new_frame = new_frame.astype(object).where(new_frame.notna(), '')
+        new = [list(new_frame.columns)] + new_frame.values.tolist()
+
+        # Posição do range na aba, para converter índices da grade em endereços.
+        letters, digits = re.match(r'([A-Z]*)([0-9]*)', rng.rpartition('!')[2].upper()).groups() # type: ignore
+        start_row = int(digits) if digits else 1
+        start_column = column_to_number(letters) if letters else 0
+
+        # Diff célula a célula; cada sequência de células alteradas numa linha vira um range.
+        updates = []
+        changed_cells = 0
+        for i in range(max(len(old), len(new))):
+            old_row = old[i] if i < len(old) else []
+            new_row = new[i] if i < len(new) else []
+            run_start, run = None, []
+            for j in range(max(len(old_row), len(new_row)) + 1):
+                old_value = old_row[j] if j < len(old_row) else ''
+                new_value = new_row[j] if j < len(new_row) else ''
+                if j < max(len(old_row), len(new_row)) and old_value != new_value and str(old_value) != str(new_value):
+                    if run_start is None:
+                        run_start = j
+                    run.append(new_value)
+                elif run_start is not None:
+                    updates.append((f'{number_to_column(start_column + run_start)}{start_row + i}', [run]))
+                    changed_cells += len(run)
+                    run_start, run = None, []
+
+        if not updates:
+            details['changed_cells'] = 0
+            return Response.success(details = details)
+        response = self.update_many(updates, value_input_option = value_input_option)
+        if response.ok:
+            response.details['rng'] = rng # type: ignore
+            response.details['changed_cells'] = changed_cells # type: ignore
+        elif response.error:
+            response.error.function_name = function_name
+        return response
+
     def to_csv(self, fp, rng = '', sep = ','):
-        "Função que pega os dados de uma planilha e salva em formato CSV."
+        "Função que pega os dados de uma planilha e salva em formato CSV. fp pode ser um caminho ou um arquivo já aberto (modo texto)."
         values = self.get_values(rng)
         if values.data:
-            pd.DataFrame(values.data).to_csv(fp, index = False, sep = sep, header = False)
+            rows = values.data if isinstance(values.data, list) else [[values.data]]
+            # A API omite células vazias no fim das linhas; completamos para manter o número de colunas.
+            width = max(map(len, rows))
+            padded = (row if len(row) == width else row + [''] * (width - len(row)) for row in rows)
+            if hasattr(fp, 'write'):
+                csv.writer(fp, delimiter = sep, lineterminator = '\n').writerows(padded)
+                return
+            with open(fp, 'w', newline = '', encoding = 'utf-8') as f:
+                csv.writer(f, delimiter = sep, lineterminator = '\n').writerows(padded)
+
+    def to_df(self, rng = '', headers = [], dtype = None, dtype_backend = None,
+              value_render_option:ValueRenderOption = 'FORMATTED_VALUE'):
+        """
+        Reads a range and returns it as a pandas DataFrame.
 
-    def to_df(self, rng = '', headers = [], dtype = None):
-        values = self.get_values(rng).data
+        Args:
+            rng (str | list[str], optional): Range in the Excel format. Defaults to the whole tab.
+                If a list of ranges is given, they are read with a single `values.batchGet` request
+                and a list of DataFrames is returned, in the same order.
+            headers (list, optional): Column names. If not given, the first row is used.
+            dtype (optional): dtype to cast the DataFrame to. A single dtype is applied while the frame
+                is built; a dict of per-column dtypes is applied afterwards with `astype`.
+            dtype_backend (str, optional): If set ('numpy_nullable' or 'pyarrow'), the columns
+                are converted with `DataFrame.convert_dtypes` using that backend. With 'pyarrow'
+                and pyarrow installed, the frame is built column by column straight into Arrow
+                arrays, which is faster and lighter for large string-heavy reads.
+            value_render_option (ValueRenderOption, optional): Passed to `get_values`. UNFORMATTED_VALUE
+                returns numbers as numbers instead of locale-formatted strings.
+
+        Returns:
+            pd.DataFrame | list[pd.DataFrame]: The data, or an empty DataFrame if nothing was read or conversion failed.
+        """
+        if isinstance(rng, (list, tuple)):
+            # Vários ranges: uma única chamada ao values.batchGet em vez de uma por range.
+            request_ranges = [self._request_range(r) for r in rng]
+            if None in request_ranges:
+                import pandas as pd
+                return [pd.DataFrame() for _ in rng]
+            return self.parent_spreadsheet.to_dfs(request_ranges, headers = headers, dtype = dtype, # type: ignore
+                                                  dtype_backend = dtype_backend,
+                                                  value_render_option = value_render_option)
+        values = self.get_values(rng, value_render_option = value_render_option).data
+        return _values_frame(values, headers, dtype, dtype_backend)
+
+class BatchContext:
+    """
+    Context manager returned by `Spreadsheet.batch()` and `Sheet.batch()`.
+
+    Opens a value batch on enter and flushes it on a clean exit. If the block raises,
+    the writes still queued are discarded and the exception propagates.
+
+    Attributes:
+        spreadsheet (Spreadsheet): Spreadsheet that owns the queued writes.
+        value_input_option (InputOption): Input mode used by the batch.
+        response (Response | None): Result of the flush, available after the block exits. If both
+            queues were flushed, it's the first failed Response, or the structural one if both succeeded.
+    """
+    def __init__(self, spreadsheet:Spreadsheet, value_input_option:InputOption = 'USER_ENTERED'):
+        self.spreadsheet = spreadsheet
+        self.value_input_option = value_input_option
+        self.response = None
+        self._queued_before = 0
+        self._queue = None
+
+    def __enter__(self) -> BatchContext:
+        self.spreadsheet._value_batch_option = self.value_input_option
+        self._queue = self.spreadsheet.batch_requests
+        self._queued_before = len(self._queue)
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> bool:
+        spreadsheet = self.spreadsheet
         try:
-            if values:
-                if not headers and len(values)>1:
-                    headers = values[0]
-                    values = values[1:]
-                if not headers:
-                    headers = [n for n in range(len(values[0]))]
-                return pd.DataFrame(values, columns = headers, dtype = dtype)
+            if exc_type is None:
+                self.response = spreadsheet._flush_batches()
             else:
-                return pd.DataFrame()
-        except Exception as e:
-            print(f"Not possible to create dataframe: {e}.\nReturning empty one instead.")
-            return pd.DataFrame()
-
+                spreadsheet.batch_value_requests.clear()
+                spreadsheet.batch_clear_ranges.clear()
+                if spreadsheet.batch_requests is self._queue:
+                    del spreadsheet.batch_requests[self._queued_before:] # Só o que foi enfileirado dentro do bloco
+                else:
+                    spreadsheet.batch_requests.clear() # Houve flush no meio do bloco: a fila nova é toda do bloco
+        finally:
+            spreadsheet._value_batch_option = None
+        return False
@@ -1,10 +1,15 @@
 from dataclasses import dataclass, field
 from typing import Generic, TypeVar, Optional, Any, Literal
 from datetime import datetime
+import sys
+import time
 
 T = TypeVar('T')
 
-@dataclass
+# slots=True só existe a partir do Python 3.10; nas versões anteriores fica o dataclass comum.
+_DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+@dataclass(**_DATACLASS_SLOTS)
 class SheetsError:
     """
     Standardized error container for API or library exceptions.
@@ -26,7 +31,7 @@ class SheetsError:
     function_name: Optional[str] = None
     details: Any = None
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class Response(Generic[T]):
     """
     Universal response wrapper for all library operations.
@@ -40,7 +45,8 @@ class Response(Generic[T]):
             doesn't expect a data response.
         error (SheetsError, optional): An error object containing details if the operation failed.
         ok (bool): Success flag. Returns `True` if the operation succeeded, `False` otherwise.
-        date (datetime): Timestamp of when the response object was created.
+        timestamp (float): Unix time of when the response object was created.
+        date (datetime): `timestamp` as a local `datetime`, built only when accessed.
         details (Any, optional): Extra metadata or debugging info regarding the request execution.
             Generally structured like a dcitionary with the request's information.
     """
@@ -48,9 +54,15 @@ class Response(Generic[T]):
     data: Optional[T] = None
     error: Optional[SheetsError] = None
     ok: bool = False
-    date: datetime = field(default_factory=datetime.now)
+    # time.time() é bem mais barato que datetime.now(); o datetime só é montado se alguém ler `date`.
+    timestamp: float = field(default_factory=time.time)
     details: Optional[Any] = None
 
+    @property
+    def date(self) -> datetime:
+        """Timestamp of when the response object was created, as a local `datetime`."""
+        return datetime.fromtimestamp(self.timestamp)
+
     @classmethod
     def success(cls, data: T = None, details = None) -> "Response[T]":
         """
@@ -111,4 +123,27 @@ Indicates which dimension operations should apply to.
 Values:
     ROWS: Operates on rows (horizontal).
     COLUMNS: Operates on columns (vertical).
-"""
\ No newline at end of file
+"""
+
+ValueRenderOption = Literal['FORMATTED_VALUE', 'UNFORMATTED_VALUE', 'FORMULA']
+"""
+Determines how values should be rendered in the output.
+
+Values:
+    FORMATTED_VALUE: Values are calculated and formatted according to the cell's formatting,
+                     as displayed in the UI (e.g. "1,234.56", "$10.00").
+    UNFORMATTED_VALUE: Values are calculated but not formatted. Numbers come back as
+                       JSON numbers, which is smaller over the wire and needs no parsing.
+    FORMULA: Values are not calculated; formulas are returned as written (e.g. "=A1+B1").
+"""
+
+DateTimeRenderOption = Literal['SERIAL_NUMBER', 'FORMATTED_STRING']
+"""
+Determines how dates, times and durations should be rendered in the output.
+Ignored if the value render option is FORMATTED_VALUE.
+
+Values:
+    SERIAL_NUMBER: Dates are returned as "serial number" doubles, as in Lotus 1-2-3
+                   (days since December 30th 1899).
+    FORMATTED_STRING: Dates are returned as strings, formatted by the cell's number format.
+"""
@@ -0,0 +1,93 @@
+import logging
+import threading
+import time
+from typing import Hashable
+
+logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket used to keep requests under the API quota.
+
+    The bucket holds up to `rate` tokens and refills continuously at `rate` tokens
+    every `per` seconds. Each request takes one token; when the bucket is empty the
+    caller sleeps until a token is available, instead of being answered with a 429.
+
+    Attributes:
+        rate (float): Bucket capacity and number of tokens added every `per` seconds.
+        per (float): Refill period, in seconds.
+
+    Args:
+        rate (float, optional): Requests allowed per period. Defaults to 60.
+        per (float, optional): Period in seconds. Defaults to 60.
+
+    Example:
+        ```python
+        bucket = TokenBucket(rate = 60, per = 60.0) # 60 requests per minute
+        bucket.acquire()
+        request.execute()
+        ```
+    """
+    def __init__(self, rate: float = 60, per: float = 60.0):
+        self.rate = rate
+        self.per = per
+        self._tokens = float(rate)
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Takes one token, blocking until one is available."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.rate, self._tokens + (now - self._last) * self.rate / self.per)
+                self._last = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) * self.per / self.rate
+            time.sleep(wait)
+
+    def set_rate(self, rate: float, per: float = 60.0):
+        """Changes the refill rate. Tokens gathered so far are kept, up to the new capacity."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.rate, self._tokens + (now - self._last) * self.rate / self.per)
+            self._last = now
+            self.rate = rate
+            self.per = per
+            self._tokens = min(self._tokens, float(rate))
+
+
+_BUCKETS: dict[Hashable, TokenBucket] = {}
+_BUCKETS_LOCK = threading.Lock()
+
+def get_bucket(key: Hashable, rate: float = 60, per: float = 60.0, update: bool = True) -> TokenBucket:
+    """
+    Returns the bucket shared by every caller using the same key, creating it if needed.
+
+    Keying by the OAuth client id makes all `ClientWrapper`s of the same project draw from
+    one bucket, so the per-project quota isn't counted once per instance.
+
+    Args:
+        key (Hashable): Bucket identity, e.g. the OAuth client id.
+        rate (float, optional): Requests allowed per period.
+        per (float, optional): Period in seconds.
+        update (bool, optional): If the bucket already exists with a different rate, change it to
+            this one (and log a warning, since every caller sharing the key is affected). If False,
+            the existing rate is kept. Defaults to True.
+
+    Returns:
+        TokenBucket: The shared bucket.
+    """
+    with _BUCKETS_LOCK:
+        bucket = _BUCKETS.get(key)
+        if bucket is None:
+            bucket = _BUCKETS[key] = TokenBucket(rate, per)
+        elif update and (bucket.rate, bucket.per) != (rate, per):
+            logger.warning('Rate limiter for %s changed from %s to %s requests per %ss; shared by every client using it.',
+                           key, bucket.rate, rate, per)
+            bucket.set_rate(rate, per)
+        return bucket
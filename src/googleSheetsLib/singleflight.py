@@ -0,0 +1,69 @@
+import threading
+from typing import Any, Callable, Hashable
+
+
+class _Call:
+    """In-flight call shared by every caller of the same key."""
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.exception: BaseException | None = None
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent calls that share the same key into a single execution.
+
+    The first caller of a key runs the function; callers that arrive while it is
+    still running wait for it and receive the very same result (or exception).
+    Once the call finishes the key is released, so later callers trigger a new
+    execution. Nothing is cached beyond the lifetime of the call.
+
+    Example:
+        ```python
+        flights = SingleFlight()
+
+        # Ten threads asking for the same range issue a single request.
+        response = flights.do(('get', spreadsheet_id, 'Sales!A1:C10'), lambda: client.execute(request))
+        ```
+    """
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: dict[Hashable, _Call] = {}
+
+    def do(self, key: Hashable, fn: Callable[[], Any]) -> Any:
+        """
+        Runs `fn` unless a call with the same key is already in flight, in which
+        case it waits for that call and returns its result.
+
+        Args:
+            key (Hashable): Identifies equivalent calls.
+            fn (Callable): Zero-argument function that performs the work.
+
+        Returns:
+            Any: The value returned by `fn`, shared among all concurrent callers.
+
+        Raises:
+            Exception: Whatever `fn` raised, re-raised for every waiting caller.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+
+        if not leader:
+            call.done.wait()
+        else:
+            try:
+                call.result = fn()
+            except BaseException as e:
+                call.exception = e
+            finally:
+                with self._lock:
+                    del self._calls[key]
+                call.done.set()
+
+        if call.exception is not None:
+            raise call.exception
+        return call.result
@@ -1,34 +1,46 @@
 import re
-
+import logging
+from functools import lru_cache
+
+logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
+
+# Padrões de range compilados uma única vez no import. re.ASCII: \d não aceita dígitos unicode (ex.: '١').
+_XRANGE_PATTERNS = {
+    # Célula única (A1) ou range completo (A1:B2) num só padrão: col2/row2 ficam None na célula única.
+    "full": re.compile(r"^(?P<col1>[A-Z]+)(?P<row1>[1-9][0-9]*)(?::(?P<col2>[A-Z]+)(?P<row2>[1-9][0-9]*))?$", re.ASCII),
+    "col_only": re.compile(r"^(?P<col1>[A-Z]+):(?P<col2>[A-Z]+)$", re.ASCII),
+    "row_only": re.compile(r"^(?P<row1>[1-9][0-9]*):(?P<row2>[1-9][0-9]*)$", re.ASCII)
+}
+_CELL_RE = re.compile(r'^[A-Z]+\d+$', re.ASCII)
+_XRANGE_RE = re.compile(r'^[A-Z]+\d+:[A-Z]+\d+$', re.ASCII)
+
+@lru_cache(maxsize=1024)
 def column_to_number(column_string:str) -> int:
   "Função que transforma uma string de letras de coluna em um índice de coluna (base 0)"
   x = 0
-  for i in range(len(column_string)):
-    x += 26**(len(column_string) - i - 1)*(ord(column_string[i])-64)
+  for ch in column_string:    # Horner: cada letra é um dígito em base 26 (A=1 ... Z=26)
+    x = x*26 + (ord(ch) - 64)
   return x-1
 
+@lru_cache(maxsize=1024)
 def number_to_column(column_int:int) -> str:
   "Função que transforma um índice de coluna base 0 em uma string de letras de coluna"
-  start_index = 0   #  it can start either at 0 or at 1
-  letter = ''
-  while column_int > 25 + start_index:   
-    letter += chr(65 + int((column_int-start_index)/26) - 1)
-    column_int = column_int - (int((column_int-start_index)/26))*26
-  letter += chr(65 - start_index + (int(column_int)))
-  return letter
+  letters = []
+  n = int(column_int)
+  while n >= 0:
+    n, r = divmod(n, 26)
+    letters.append(chr(65 + r))
+    n -= 1
+  return ''.join(reversed(letters))
 
 def xrange_to_grid_range(xrange:str) -> dict:
   "Função que transforma um range do tipo A1:B2 em um dicionário grid_range com índice base 0 exclusivo"
-  if not validate_xrange(xrange):
+  indexes = _xrange_indexes(xrange)
+  if indexes is None:
     return dict()
-  columns = re.findall(r'[A-Z]+', xrange) + ['A','A']      # Colocando valores extras para não dar xabu
-  lines = re.findall(r'[0-9]+', xrange) + ['0','0']        # Colocando valores extras para não dar xabu
-
-  start_column = column_to_number(columns[0])
-  end_column = column_to_number(columns[1])+1          # Offset para converter de range inclusivo para exclusivo.
-  start_row = int(lines[0])-1                          # Offset do base 0
-  end_row = int(lines[1])                              # Como é exclusivo, mantém linha original.
-    
+  start_row, end_row, start_column, end_column = indexes
+  # Dict novo a cada chamada: quem chama costuma alterá-lo (ex.: get_values_delta).
   grid_range = {"startRowIndex": start_row,
     "endRowIndex": end_row,
     "startColumnIndex": start_column,
@@ -36,58 +48,80 @@ def xrange_to_grid_range(xrange:str) -> dict:
 
   return grid_range
 
+@lru_cache(maxsize=4096)
+def _xrange_indexes(xrange:str):
+  "Índices (start_row, end_row, start_column, end_column) de um range, ou None se for inválido. Em cache."
+  if not validate_xrange(xrange):
+    return None
+  xrange = xrange.upper().strip().rpartition('!')[2]
+  patterns = _XRANGE_PATTERNS
+
+  # Um único match com grupos nomeados. Início em base 0; fim exclusivo, então mantém o número original.
+  match = patterns["full"].fullmatch(xrange)
+  if match:
+    col1, row1, col2, row2 = match.groups()
+    if col2 is None:        # Célula única: início e fim são a mesma célula
+      col2, row2 = col1, row1
+    return (int(row1)-1, int(row2), column_to_number(col1), column_to_number(col2)+1)
+
+  # Ranges só de colunas (A:C) ou só de linhas (2:5) mantêm os índices que sempre tiveram.
+  match = patterns["col_only"].fullmatch(xrange)
+  if match:
+    return (-1, 0, column_to_number(match['col1']), column_to_number(match['col2'])+1)
+  match = patterns["row_only"].fullmatch(xrange)
+  return (int(match['row1'])-1, int(match['row2']), 0, 1) # type: ignore
+
 def grid_range_to_xrange(grid_range:dict) -> str:
     if not validate_grid_range(grid_range):
-        print('Erro ao converter grid range para xrange: grid range inválido.')
+        logger.debug('Erro ao converter grid range para xrange: grid range inválido.')
         return ""
-    first_row = grid_range['startRowIndex']+1                           # Offset de um pela base 0
-    second_row = grid_range['endRowIndex']
-    first_column = number_to_column(grid_range['startColumnIndex'])
-    second_column = number_to_column(grid_range['endColumnIndex']-1)    # Offset de um pelo range exclusivo.
-    return f'{first_column}{first_row}:{second_column}{second_row}'
-
+    # Um lookup por chave; number_to_column já está em cache, então sobra pouco além disso.
+    start_row = grid_range['startRowIndex']
+    end_row = grid_range['endRowIndex']
+    start_column = grid_range['startColumnIndex']
+    end_column = grid_range['endColumnIndex']
+    # Offset de um na linha inicial pela base 0 e na coluna final pelo range exclusivo.
+    return f'{number_to_column(start_column)}{start_row+1}:{number_to_column(end_column-1)}{end_row}'
+
+@lru_cache(maxsize=4096)
 def validate_xrange(xrange_str: str):
     "Função que valida ranges do formato do excel (A1:B2). São aceitos no formato A1:B2, A1, A:A, 1:1"
     # Algo importante é que eu pressuponho que o segundo range é maior que o primeiro. Não aceito B2:A1 p.e
-    xrange_str = xrange_str.upper().strip()
-    
-    if '!' in xrange_str:
-      xrange_str = xrange_str.split('!')[-1]
-
-    patterns = {
-        "full": r"^(?P<col1>[A-Z]+)(?P<row1>[1-9][0-9]*):(?P<col2>[A-Z]+)(?P<row2>[1-9][0-9]*)$",
-        "single": r"^[A-Z]+[1-9][0-9]*$",
-        "col_only": r"^(?P<col1>[A-Z]+):(?P<col2>[A-Z]+)$",
-        "row_only": r"^(?P<row1>[1-9][0-9]*):(?P<row2>[1-9][0-9]*)$"
-    }
-
-    # 1. Caso: Célula Única (A1)
-    if re.fullmatch(patterns["single"], xrange_str):
-        return True
-
-    # 2. Caso: Range Completa (A1:B2)
-    match = re.fullmatch(patterns["full"], xrange_str)
+    # Resultado em cache: ranges se repetem muito em loops de leitura/escrita.
+    xrange_str = xrange_str.upper().strip().rpartition('!')[2]
+
+    patterns = _XRANGE_PATTERNS
+
+    # 1. e 2. Casos: Célula Única (A1) e Range Completa (A1:B2)
+    match = patterns["full"].fullmatch(xrange_str)
     if match:
         d = match.groupdict()
+        if d['col2'] is None:
+            return True
         # Validação de ordem (opcional, dependendo da sua necessidade)
         row_ok = int(d['row1']) <= int(d['row2'])
         col_ok = column_to_number(d['col1']) <= column_to_number(d['col2'])
         return row_ok and col_ok
 
     # 3. Caso: Colunas (A:B)
-    match = re.fullmatch(patterns["col_only"], xrange_str)
+    match = patterns["col_only"].fullmatch(xrange_str)
     if match:
         d = match.groupdict()
         return column_to_number(d['col1']) <= column_to_number(d['col2'])
 
     # 4. Caso: Linhas (1:10)
-    match = re.fullmatch(patterns["row_only"], xrange_str)
+    match = patterns["row_only"].fullmatch(xrange_str)
     if match:
         d = match.groupdict()
         return int(d['row1']) <= int(d['row2'])
 
     return False
 
+def validate_xranges(xranges) -> list[bool]:
+    "Valida vários ranges de uma vez. Retorna uma lista de booleanos na mesma ordem da entrada."
+    # Repetições saem direto do cache de validate_xrange.
+    return [validate_xrange(xrange_str) for xrange_str in xranges]
+
 def validate_grid_range(grid_range:dict, expect_sheet_id = False) -> bool:
   "Função que valida um objeto do tipo grid range."
   # Schema esperado: gridRange = {
@@ -99,44 +133,53 @@ def validate_grid_range(grid_range:dict, expect_sheet_id = False) -> bool:
   # }
 
   if not isinstance(grid_range, dict):
-    print('Grid Range Object is not a dictionary.')
-  
-  expected_fields = {"startRowIndex","endRowIndex","startColumnIndex","endColumnIndex"}
-  if expect_sheet_id:
-    expected_fields.add('sheetId')
-
-  grid_range_keys = set(grid_range.keys())
+    logger.debug('Grid Range Object is not a dictionary.')
+    return False
 
-  if grid_range_keys != expected_fields:
-    print(f"Unexpected keys in Grid Range. Expected: {expected_fields}. Actual: {grid_range_keys}.")
+  # Checagem direta das chaves, sem montar sets a cada chamada.
+  if (len(grid_range) != (5 if expect_sheet_id else 4)
+      or 'startRowIndex' not in grid_range or 'endRowIndex' not in grid_range
+      or 'startColumnIndex' not in grid_range or 'endColumnIndex' not in grid_range
+      or (expect_sheet_id and 'sheetId' not in grid_range)):
+    expected_fields = {"startRowIndex","endRowIndex","startColumnIndex","endColumnIndex"}
+    if expect_sheet_id:
+      expected_fields.add('sheetId')
+    logger.debug("Unexpected keys in Grid Range. Expected: %s. Actual: %s.", expected_fields, set(grid_range))
     return False
-  
+
+  start_row = grid_range['startRowIndex']
+  end_row = grid_range['endRowIndex']
+  start_column = grid_range['startColumnIndex']
+  end_column = grid_range['endColumnIndex']
+
   # Checando se os índices são inteiros.
-  for key, value in grid_range.items():
-    if key != 'sheetId' and not isinstance(value, int):
-      print(f'Unexpected value for {key}. Expected int. Got {type(value)}.')
+  for key, value in (('startRowIndex', start_row), ('endRowIndex', end_row),
+                     ('startColumnIndex', start_column), ('endColumnIndex', end_column)):
+    if not isinstance(value, int):
+      logger.debug('Unexpected value for %s. Expected int. Got %s.', key, type(value))
       return False
     elif value < 0:
-      print(f'{key} value out of bounds: {value}.')
+      logger.debug('%s value out of bounds: %s.', key, value)
   
   # Checando se os índices fazem sentido.
-  if grid_range['startRowIndex'] >= grid_range['endRowIndex']:
-    print(f'Index error: start row index overlaps end index.')
+  if start_row >= end_row:
+    logger.debug('Index error: start row index overlaps end index.')
     return False
-  elif grid_range['startColumnIndex'] >= grid_range['endColumnIndex']:
-    print(f'Index error: start column index overlaps end index.')
+  elif start_column >= end_column:
+    logger.debug('Index error: start column index overlaps end index.')
     return False
 
   return True
 
+@lru_cache(maxsize=1024)
 def is_cell(cell:str):
   'Função que detecta se um dado valor é uma célula.'
   cell = cell.upper()
-  return re.search(r'^[A-Z]{1,}\d{1,}$', cell) != None
+  return _CELL_RE.search(cell) != None
 
 def is_xrange(xrange:str):
   rng = xrange.upper()
-  return re.search(r'^[A-Z]{1,}\d{1,}:[A-Z]{1,}\d{1,}$', rng) != None
+  return _XRANGE_RE.search(rng) != None
 
 def get_values_delta(start_cell = 'A1', values: list[list] = [[]]):
   'Dada uma célula inicial e uma lista de valores, calcula o range completo para aqueles valores.'